@@ -0,0 +1,390 @@
+"""Static HTML fragments for the Streamlit page.
+
+Everything here is rendered once when the module is first imported; Streamlit
+reruns only re-execute app.py, so each rerun reuses these strings as-is.
+"""
+from datetime import datetime
+
+from converter import CATEGORIES
+
+# Custom CSS for professional styling
+CSS = """
+<style>
+    /* Main container styling */
+    .main {
+        background-color: #f8f9fa;
+        padding: 0;
+    }
+    
+    /* Header styling */
+    .header-container {
+        background: linear-gradient(90deg, #1a237e, #283593);
+        padding: 2rem 3rem;
+        border-radius: 0 0 20px 20px;
+        margin-bottom: 2rem;
+        color: white;
+        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
+    }
+    
+    .app-title {
+        font-size: 2.5rem;
+        font-weight: 700;
+        margin-bottom: 0.5rem;
+        color: white;
+    }
+    
+    .app-subtitle {
+        font-size: 1.2rem;
+        font-weight: 300;
+        opacity: 0.9;
+        margin-bottom: 1rem;
+    }
+    
+    /* Card styling */
+    .card {
+        background-color: white;
+        border-radius: 10px;
+        padding: 1.5rem;
+        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.05);
+        margin-bottom: 1.5rem;
+        border-left: 4px solid #3f51b5;
+        transition: transform 0.3s ease, box-shadow 0.3s ease;
+    }
+    
+    .card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 8px 24px rgba(0, 0, 0, 0.1);
+    }
+    
+    /* Result styling */
+    .result-container {
+        background: linear-gradient(135deg, #3f51b5, #5c6bc0);
+        color: white;
+        padding: 2rem;
+        border-radius: 10px;
+        text-align: center;
+        box-shadow: 0 6px 18px rgba(63, 81, 181, 0.2);
+        margin: 2rem 0;
+    }
+    
+    .result-value {
+        font-size: 2.2rem;
+        font-weight: 700;
+        margin: 1rem 0;
+    }
+    
+    .result-equals {
+        font-size: 1.5rem;
+        opacity: 0.8;
+        margin: 0.5rem 0;
+    }
+    
+    /* Form controls styling */
+    .stSelectbox > div > div {
+        background-color: white;
+        border-radius: 8px !important;
+        border: 1px solid #e0e0e0 !important;
+    }
+    
+    .stNumberInput > div > div > input {
+        border-radius: 8px !important;
+        border: 1px solid #e0e0e0 !important;
+        padding: 0.5rem 1rem !important;
+    }
+    
+    /* Section headers */
+    .section-header {
+        color: #3f51b5;
+        font-size: 1.5rem;
+        font-weight: 600;
+        margin: 1.5rem 0 1rem 0;
+        border-bottom: 2px solid #e0e0e0;
+        padding-bottom: 0.5rem;
+    }
+    
+    /* Common conversions styling */
+    .common-conversion {
+        background-color: #f5f7ff;
+        padding: 0.8rem 1.2rem;
+        border-radius: 8px;
+        margin-bottom: 0.5rem;
+        border-left: 3px solid #c5cae9;
+    }
+    
+    /* Footer styling */
+    .footer {
+        text-align: center;
+        margin-top: 3rem;
+        padding: 1.5rem;
+        color: #666;
+        font-size: 0.9rem;
+        border-top: 1px solid #e0e0e0;
+    }
+    
+    /* Sidebar styling */
+    .css-1d391kg, .css-163ttbj {
+        background-color: #f1f3f9 !important;
+    }
+    
+    .sidebar-header {
+        font-size: 1.2rem;
+        font-weight: 600;
+        color: #1a237e;
+        margin-bottom: 1rem;
+    }
+    
+    /* Category badges */
+    .category-badge {
+        display: inline-block;
+        padding: 0.3rem 0.8rem;
+        border-radius: 20px;
+        font-size: 0.8rem;
+        font-weight: 500;
+        margin-right: 0.5rem;
+        margin-bottom: 0.5rem;
+        background-color: #e8eaf6;
+        color: #3f51b5;
+    }
+    
+    /* Formula styling */
+    .formula-container {
+        background-color: #f8f9fa;
+        border-radius: 8px;
+        padding: 1rem;
+        border: 1px solid #e0e0e0;
+        margin: 1rem 0;
+    }
+    
+    /* Responsive adjustments */
+    @media (max-width: 768px) {
+        .header-container {
+            padding: 1.5rem;
+        }
+        
+        .app-title {
+            font-size: 2rem;
+        }
+        
+        .result-value {
+            font-size: 1.8rem;
+        }
+    }
+</style>
+"""
+
+HEADER_HTML = """
+<div class="header-container">
+    <h1 class="app-title">Professional Unit Converter</h1>
+    <p class="app-subtitle">Convert between different units of measurement with precision and ease</p>
+</div>
+"""
+
+SIDEBAR_HEADER_HTML = '<div class="sidebar-header">Conversion Settings</div>'
+
+# Cards are sent as a single payload each. The blank lines end the raw HTML
+# block so the body is still parsed as markdown (and LaTeX) inside the card.
+CARD_TEMPLATE = """
+<div class="card">
+<h3 class="section-header">{title}</h3>
+
+{body}
+
+</div>
+"""
+
+FORMULA_TEMPLATE = """<div class="formula-container">
+
+{formula}
+
+</div>"""
+
+RESULT_TEMPLATE = """
+<div class="result-container">
+    <p style="margin-bottom: 0; opacity: 0.8;">Conversion Result</p>
+    <div class="result-value">
+        {value:.6g} {from_unit}
+    </div>
+    <div class="result-equals">
+        = {result:.6g} {to_unit}
+    </div>
+</div>
+"""
+
+SIDEBAR_FOOTER_TEMPLATE = """
+<div class="footer" style="margin-top: 2rem; padding: 1rem; font-size: 0.8rem;">
+    <p>Last Updated: {date}</p>
+    <p>Version 2.0</p>
+</div>
+"""
+
+# LaTeX formulas for each temperature conversion
+TEMPERATURE_FORMULAS = {
+    ("celsius", "fahrenheit"): r"F = C \times \frac{9}{5} + 32",
+    ("celsius", "kelvin"): r"K = C + 273.15",
+    ("fahrenheit", "celsius"): r"C = (F - 32) \times \frac{5}{9}",
+    ("fahrenheit", "kelvin"): r"K = (F - 32) \times \frac{5}{9} + 273.15",
+    ("kelvin", "celsius"): r"C = K - 273.15",
+    ("kelvin", "fahrenheit"): r"F = (K - 273.15) \times \frac{9}{5} + 32",
+}
+
+# Information about each category
+CATEGORY_INFO = {
+    "Length": "Length is a measure of distance. Units range from microscopic to astronomical scales.",
+    "Weight/Mass": "Weight is the force exerted on an object due to gravity, while mass is the amount of matter in an object.",
+    "Temperature": "Temperature is a measure of heat energy in a system. Different scales have different reference points.",
+    "Volume": "Volume measures the three-dimensional space occupied by a substance or object.",
+    "Area": "Area measures the extent of a two-dimensional surface or region.",
+    "Time": "Time measures the duration between events or the intervals during which events occur.",
+    "Energy": "Energy is the capacity to do work or produce heat. It exists in various forms like kinetic, potential, thermal, etc.",
+    "Digital": "Digital units measure data storage capacity and transfer rates in computing systems."
+}
+
+# Common conversion examples for each category: (value, from unit, to units,
+# note). The numbers are computed by the engine, so they never drift from it.
+COMMON_CONVERSIONS = {
+    "Length": [
+        (1, "meter", ["foot"], ""),
+        (1, "kilometer", ["mile"], ""),
+        (1, "inch", ["centimeter"], ""),
+    ],
+    "Weight/Mass": [
+        (1, "kilogram", ["pound"], ""),
+        (1, "pound", ["ounce"], ""),
+        (1, "metric_ton", ["kilogram"], ""),
+    ],
+    "Temperature": [
+        (0, "celsius", ["fahrenheit", "kelvin"], " (Freezing point of water)"),
+        (100, "celsius", ["fahrenheit", "kelvin"], " (Boiling point of water)"),
+        (20, "celsius", ["fahrenheit", "kelvin"], " (Room temperature)"),
+    ],
+    "Volume": [
+        (1, "liter", ["gallon"], ""),
+        (1, "gallon", ["liter"], ""),
+        (1, "cup", ["fluid_ounce"], ""),
+    ],
+    "Area": [
+        (1, "square_meter", ["square_foot"], ""),
+        (1, "acre", ["square_meter"], ""),
+        (1, "hectare", ["square_meter"], ""),
+    ],
+    "Time": [
+        (1, "day", ["hour", "minute", "second"], ""),
+        (1, "year", ["day"], " (average Gregorian year)"),
+        (1, "month", ["day"], " (average)"),
+    ],
+    "Energy": [
+        (1, "kilowatt_hour", ["kilojoule"], ""),
+        (1, "calorie", ["joule"], ""),
+        (1, "kilocalorie", ["calorie"], " (food calorie)"),
+    ],
+    "Digital": [
+        (1, "byte", ["bit"], ""),
+        (1, "kilobyte", ["byte"], ""),
+        (1, "gigabyte", ["megabyte"], ""),
+    ],
+}
+
+TEMPERATURE_SYMBOLS = {"celsius": "°C", "fahrenheit": "°F", "kelvin": "K"}
+IRREGULAR_PLURALS = {"foot": "feet", "inch": "inches", "square_foot": "square_feet", "square_inch": "square_inches"}
+
+PRO_TIPS_HTML = """
+<ul>
+    <li><strong>Precision matters:</strong> For scientific calculations, consider using more decimal places.</li>
+    <li><strong>Unit systems:</strong> Be aware of which system (metric, imperial) you're working with.</li>
+    <li><strong>Significant figures:</strong> Maintain appropriate significant figures for your application.</li>
+</ul>
+"""
+
+FOOTER_HTML = """
+<div class="footer">
+    <p>© 2025 Professional Unit Converter | Created with Streamlit</p>
+    <p>Built with precision and reliability</p>
+</div>
+"""
+
+
+def render_card(title, body):
+    return CARD_TEMPLATE.format(title=title, body=body)
+
+
+def render_formula(category, from_unit, to_unit):
+    if category == "Temperature":
+        latex = TEMPERATURE_FORMULAS.get((from_unit, to_unit), f"{from_unit} = {to_unit}")
+        formula = f"$$\n{latex}\n$$"
+    else:
+        formula = f"Standard unit conversion using conversion factors between {from_unit} and {to_unit}."
+    return render_card("Conversion Formula", FORMULA_TEMPLATE.format(formula=formula))
+
+
+def format_quantity(value, unit):
+    if unit in TEMPERATURE_SYMBOLS:
+        return f"{value:.6g}{TEMPERATURE_SYMBOLS[unit]}"
+    name = unit if value == 1 else IRREGULAR_PLURALS.get(unit, unit + "s")
+    return f"{value:.6g} {name.replace('_', ' ')}"
+
+
+def _common_conversion(category, value, from_unit, to_units, note):
+    cat = CATEGORIES[category]
+    quantities = [format_quantity(value, from_unit)] + [
+        format_quantity(cat.convert(value, from_unit, to_unit), to_unit) for to_unit in to_units
+    ]
+    return f'<div class="common-conversion">{" = ".join(quantities)}{note}</div>'
+
+
+def render_all_units(category, value, from_unit, results):
+    """Render ``value`` in every unit of ``category`` as one table card."""
+    rows = "".join(
+        f"<tr><td>{unit.replace('_', ' ')}</td><td style=\"text-align: right;\">{result:.6g}</td></tr>"
+        for unit, result in zip(CATEGORIES[category].units, results)
+    )
+    table = f'<table style="width: 100%;"><tr><th>Unit</th><th style="text-align: right;">Value</th></tr>{rows}</table>'
+    return render_card(f"{format_quantity(value, from_unit)} in all units", table)
+
+
+def render_history(records, rerun_results=None, rerun_unit=None):
+    """Render history records, optionally with a re-run column, as one table card."""
+    header = "<tr><th>Value</th><th>From</th><th>To</th><th style=\"text-align: right;\">Result</th>"
+    if rerun_unit is not None:
+        header += f'<th style="text-align: right;">In {rerun_unit.replace("_", " ")}</th>'
+    rows = []
+    for i, (value, _, from_unit, to_unit, result) in enumerate(reversed(records)):
+        row = (f"<tr><td>{value:.6g}</td><td>{from_unit.replace('_', ' ')}</td>"
+               f"<td>{to_unit.replace('_', ' ')}</td><td style=\"text-align: right;\">{result:.6g}</td>")
+        if rerun_results is not None:
+            rerun = rerun_results[len(records) - 1 - i]
+            row += f'<td style="text-align: right;">{"—" if rerun != rerun else f"{rerun:.6g}"}</td>'
+        rows.append(row + "</tr>")
+    table = f'<table style="width: 100%;">{header}</tr>{"".join(rows)}</table>'
+    return render_card(f"History ({len(records)})", table)
+
+
+def _category_card(name):
+    return f"""
+<div class="card" style="margin-top: 1rem;">
+    <h4 style="margin-top: 0;">{name} Units</h4>
+    <p>{CATEGORY_INFO.get(name, CATEGORIES[name].info)}</p>
+</div>
+"""
+
+
+# Sidebar header and all categories as badges, in a single fragment
+SIDEBAR_HTML = SIDEBAR_HEADER_HTML + '<div style="margin-bottom: 1rem;">' + "".join(
+    f'<span class="category-badge">{c.label}</span>' for c in CATEGORIES.values()
+) + "</div>"
+
+PAGE_HEADER_HTML = CSS + HEADER_HTML
+
+# Last updated date is fixed when the server process starts
+SIDEBAR_FOOTER_HTML = SIDEBAR_FOOTER_TEMPLATE.format(date=datetime.now().strftime("%B %d, %Y"))
+
+# Category information card followed by the sidebar footer
+SIDEBAR_INFO_HTML = {name: _category_card(name) + SIDEBAR_FOOTER_HTML for name in CATEGORIES}
+
+COMMON_CONVERSIONS_HTML = {
+    name: render_card("Common Conversions", "".join(
+        _common_conversion(name, *example) for example in examples
+    ))
+    for name, examples in COMMON_CONVERSIONS.items()
+}
+
+PRO_TIPS_CARD_HTML = render_card("Pro Tips", PRO_TIPS_HTML)
@@ -0,0 +1,92 @@
+"""Micro-benchmark: per-call if/elif dispatch vs the precomputed matrix.
+
+Run with ``python -m benchmarks.bench_dispatch`` from the repository root.
+"""
+import timeit
+
+from converter import CATEGORIES, convert
+from converter.engine import (
+    AREA_TO_SQ_METER,
+    DIGITAL_TO_BIT,
+    ENERGY_TO_JOULE,
+    LENGTH_TO_METER,
+    TIME_TO_SECOND,
+    VOLUME_TO_LITER,
+    WEIGHT_TO_KG,
+)
+
+
+# The dispatch app.py used before the engine: category if/elif chain, two
+# dict lookups and a divide, and up to six branches for temperature
+def _linear(factors, value, from_unit, to_unit):
+    return value * factors[from_unit] / factors[to_unit]
+
+
+def _temperature(value, from_unit, to_unit):
+    if from_unit == to_unit:
+        return value
+    if from_unit == "celsius" and to_unit == "fahrenheit":
+        return (value * 9/5) + 32
+    elif from_unit == "celsius" and to_unit == "kelvin":
+        return value + 273.15
+    elif from_unit == "fahrenheit" and to_unit == "celsius":
+        return (value - 32) * 5/9
+    elif from_unit == "fahrenheit" and to_unit == "kelvin":
+        return (value - 32) * 5/9 + 273.15
+    elif from_unit == "kelvin" and to_unit == "celsius":
+        return value - 273.15
+    elif from_unit == "kelvin" and to_unit == "fahrenheit":
+        return (value - 273.15) * 9/5 + 32
+
+
+def legacy_convert(category, value, from_unit, to_unit):
+    if category == "Length":
+        return _linear(LENGTH_TO_METER, value, from_unit, to_unit)
+    elif category == "Weight/Mass":
+        return _linear(WEIGHT_TO_KG, value, from_unit, to_unit)
+    elif category == "Temperature":
+        return _temperature(value, from_unit, to_unit)
+    elif category == "Volume":
+        return _linear(VOLUME_TO_LITER, value, from_unit, to_unit)
+    elif category == "Area":
+        return _linear(AREA_TO_SQ_METER, value, from_unit, to_unit)
+    elif category == "Time":
+        return _linear(TIME_TO_SECOND, value, from_unit, to_unit)
+    elif category == "Energy":
+        return _linear(ENERGY_TO_JOULE, value, from_unit, to_unit)
+    elif category == "Digital":
+        return _linear(DIGITAL_TO_BIT, value, from_unit, to_unit)
+
+
+CASES = [
+    ("Length", "mile", "kilometer"),
+    ("Temperature", "kelvin", "fahrenheit"),
+    ("Digital", "gigabyte", "megabyte"),
+]
+
+
+def _best(func, number, repeat):
+    # Best of several runs: the least disturbed by other load on the machine
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+
+def run(number=200_000, repeat=5):
+    results = {}
+    for category, from_unit, to_unit in CASES:
+        cat = CATEGORIES[category]
+        i, j = cat.index[from_unit], cat.index[to_unit]
+        results[category] = {
+            "legacy": _best(lambda: legacy_convert(category, 12.5, from_unit, to_unit), number, repeat),
+            "convert": _best(lambda: convert(category, 12.5, from_unit, to_unit), number, repeat),
+            "category": _best(lambda: cat.convert(12.5, from_unit, to_unit), number, repeat),
+            "index": _best(lambda: cat.convert_index(12.5, i, j), number, repeat),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    for category, timings in run().items():
+        legacy = timings["legacy"]
+        print(f"{category}:")
+        for name, ns in timings.items():
+            print(f"  {name:<9} {ns:8.1f} ns/call  ({legacy / ns:4.2f}x)")
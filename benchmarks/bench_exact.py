@@ -0,0 +1,49 @@
+"""Benchmark: float vs exact (Fraction/Decimal) conversion cost.
+
+Run with ``python -m benchmarks.bench_exact`` from the repository root.
+"""
+import timeit
+from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
+
+from converter import CATEGORIES, convert_many
+
+CASES = [
+    ("Length", "mile", "kilometer"),
+    ("Temperature", "fahrenheit", "celsius"),
+]
+
+
+def run(number=50_000, size=10_000, repeat=5):
+    results = {}
+    for category, from_unit, to_unit in CASES:
+        cat = CATEGORIES[category]
+        floats = np.linspace(0, 1000, size)
+        fractions = [Fraction(v) for v in floats]
+        scalar = {
+            "float": timeit.timeit(lambda: cat.convert(12.5, from_unit, to_unit), number=number),
+            "fraction": timeit.timeit(lambda: cat.convert_exact(Fraction(25, 2), from_unit, to_unit), number=number),
+            "decimal": timeit.timeit(lambda: cat.convert_exact(Decimal("12.5"), from_unit, to_unit), number=number),
+        }
+        batch = {
+            "float": min(timeit.repeat(lambda: convert_many(floats, from_unit, to_unit), number=1, repeat=repeat)),
+            "fraction": min(timeit.repeat(lambda: convert_many(fractions, from_unit, to_unit, exact=True),
+                                          number=1, repeat=repeat)),
+        }
+        results[category] = {
+            "scalar_ns": {k: t / number * 1e9 for k, t in scalar.items()},
+            "batch_ns_per_value": {k: t / size * 1e9 for k, t in batch.items()},
+        }
+    return results
+
+
+if __name__ == "__main__":
+    for category, modes in run().items():
+        print(f"{category}:")
+        for path, timings in modes.items():
+            base = timings["float"]
+            print(f"  {path}:")
+            for name, ns in timings.items():
+                print(f"    {name:<9} {ns:10.1f} ns  ({ns / base:7.1f}x float)")
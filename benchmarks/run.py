@@ -0,0 +1,190 @@
+"""Benchmark suite for the conversion hot paths.
+
+Times scalar conversions, batch throughput, streaming file conversion and a
+full rerun of app.py, writes the results as JSON and checks them against
+regression thresholds::
+
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --baseline previous.json --tolerance 0.25
+
+Every metric is "lower is better" (nanoseconds per call, value or row, or
+milliseconds per rerun). Absolute ceilings live in ``thresholds.json``; a
+previous results file can additionally be given as a relative baseline.
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import runpy
+import subprocess
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+from converter import CATEGORIES, convert, convert_many
+from converter import engine
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+THRESHOLDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "thresholds.json")
+
+SCALAR_FUNCTIONS = {
+    "convert_length": (engine.convert_length, "mile", "kilometer"),
+    "convert_weight": (engine.convert_weight, "pound", "kilogram"),
+    "convert_temperature": (engine.convert_temperature, "fahrenheit", "celsius"),
+    "convert_volume": (engine.convert_volume, "gallon", "liter"),
+    "convert_area": (engine.convert_area, "acre", "hectare"),
+    "convert_time": (engine.convert_time, "week", "second"),
+    "convert_energy": (engine.convert_energy, "kilowatt_hour", "joule"),
+    "convert_digital": (engine.convert_digital, "gigabyte", "byte"),
+}
+BATCH_SIZES = (1_000, 100_000, 1_000_000)
+
+
+def _best(func, number, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def bench_scalar(number=100_000):
+    results = {}
+    for name, (func, from_unit, to_unit) in SCALAR_FUNCTIONS.items():
+        results[f"scalar.{name}_ns"] = _best(lambda: func(12.5, from_unit, to_unit), number) * 1e9
+    results["scalar.convert_ns"] = _best(lambda: convert("Length", 12.5, "mile", "kilometer"), number) * 1e9
+    cat = CATEGORIES["Temperature"]
+    results["scalar.convert_index_ns"] = _best(lambda: cat.convert_index(12.5, 1, 0), number) * 1e9
+    results["scalar.convert_exact_ns"] = _best(
+        lambda: cat.convert_exact(12.5, "fahrenheit", "celsius"), number // 10) * 1e9
+    return results
+
+
+def bench_batch(sizes=BATCH_SIZES):
+    results = {}
+    for size in sizes:
+        values = np.linspace(0, 1000, size)
+        out = np.empty_like(values)
+        number = max(1, 1_000_000 // size)
+        seconds = _best(lambda: convert_many(values, "kelvin", "fahrenheit", out=out), number)
+        results[f"batch.n{size}_ns_per_value"] = seconds / size * 1e9
+    return results
+
+
+def bench_stream(rows=200_000):
+    from converter.stream import convert_file
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src, dst = os.path.join(tmp, "in.csv"), os.path.join(tmp, "out.csv")
+        rng = np.random.default_rng(0)
+        with open(src, "w") as f:
+            f.write("id,distance\n")
+            f.writelines(f"{i},{v:.4f}\n" for i, v in enumerate(rng.random(rows) * 100))
+        seconds = _best(lambda: convert_file(src, dst, ["distance"], "mile", "kilometer"), 1, repeat=3)
+    return {"stream.csv_ns_per_row": seconds / rows * 1e9}
+
+
+# Run in a fresh interpreter, so nothing this process has imported is reused
+COLD_RUN = """
+import contextlib, io, runpy, sys, time
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+    runpy.run_path(sys.argv[1], run_name="__main__")
+print((time.perf_counter() - start) * 1e3)
+"""
+
+
+def bench_rerun(number=20, cold_runs=3):
+    """Time full executions of app.py in Streamlit's bare mode.
+
+    A cold start (importing Streamlit, NumPy and the engine, then running the
+    script) is timed in fresh subprocesses, best of ``cold_runs``, excluding
+    interpreter startup. Warm reruns reuse loaded modules in this process
+    the way a server rerun does.
+    """
+    path = os.path.join(ROOT, "app.py")
+    cold = min(
+        float(subprocess.run([sys.executable, "-c", COLD_RUN, path], cwd=ROOT, check=True,
+                             capture_output=True, text=True).stdout.split()[-1])
+        for _ in range(cold_runs)
+    )
+
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            runpy.run_path(path, run_name="__main__")
+
+    run()  # load Streamlit and the app's modules before timing reruns
+    return {
+        "rerun.cold_ms": cold,
+        "rerun.warm_ms": _best(run, number, repeat=3) * 1e3,
+    }
+
+
+SUITES = {
+    "scalar": bench_scalar,
+    "batch": bench_batch,
+    "stream": bench_stream,
+    "rerun": bench_rerun,
+}
+
+
+def check(results, thresholds, baseline=None, tolerance=0.25):
+    """Return a list of human-readable regressions."""
+    failures = []
+    for name, value in results.items():
+        limit = thresholds.get(name)
+        if limit is not None and value > limit:
+            failures.append(f"{name}: {value:.1f} exceeds threshold {limit:.1f}")
+        if baseline and name in baseline and value > baseline[name] * (1 + tolerance):
+            failures.append(f"{name}: {value:.1f} is more than {tolerance:.0%} over baseline "
+                            f"{baseline[name]:.1f}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.split("\n")[0])
+    parser.add_argument("suites", nargs="*", help=f"suites to run: {', '.join(SUITES)} (default: all)")
+    parser.add_argument("-o", "--output", help="write results JSON here (default: stdout)")
+    parser.add_argument("--thresholds", default=THRESHOLDS, help="JSON of absolute ceilings per metric")
+    parser.add_argument("--baseline", help="previous results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown over baseline")
+    args = parser.parse_args(argv)
+    unknown = set(args.suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suites: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for name in args.suites or SUITES:
+        results.update(SUITES[name]())
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    with open(args.thresholds) as f:
+        thresholds = json.load(f)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+    failures = check(results, thresholds, baseline, args.tolerance)
+    for failure in failures:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Vectorized conversion of whole arrays of values with NumPy."""
+import numpy as np
+
+from .engine import UNIT_CATEGORIES, find_category, get_category
+
+
+class _Tables(dict):
+    # Category name -> one column of its float matrix as an array, built the
+    # first time the category is converted to every unit at once
+    def __init__(self, column):
+        super().__init__()
+        self.column = column
+
+    def __missing__(self, name):
+        table = self[name] = np.array([[pair[self.column] for pair in row]
+                                       for row in get_category(name).matrix])
+        return table
+
+
+SCALES = _Tables(0)
+OFFSETS = _Tables(1)
+
+
+def _as_array(values):
+    arr = np.asarray(values)
+    if arr.dtype.kind != "f":
+        arr = arr.astype(np.float64)
+    return arr
+
+
+def convert_many(values, from_unit, to_unit, category=None, out=None, exact=False):
+    """Convert an array, sequence or buffer of values in one pass.
+
+    Every conversion, including the affine temperature scales, is applied as
+    ``values * scale + offset``. Floating point inputs keep their dtype; other
+    inputs are converted as float64. Pass ``out`` (which may be the input
+    array itself) to write the result without allocating.
+
+    With ``exact=True`` the result is an object array of ``Fraction`` (or
+    ``Decimal``) values computed element by element with the exact factors.
+    """
+    if category is None:
+        cat = find_category(from_unit, to_unit)
+    else:
+        cat = get_category(category)
+    if exact:
+        convert_exact = np.frompyfunc(lambda v: cat.convert_exact(v, from_unit, to_unit), 1, 1)
+        return convert_exact(np.asarray(values, dtype=object), out=out)
+    scale, offset = cat.coefficients(from_unit, to_unit)
+    return apply_coefficients(values, scale, offset, out=out)
+
+
+def apply_coefficients(values, scale, offset, out=None):
+    """Return ``values * scale + offset`` computed in place over one array."""
+    arr = _as_array(values)
+    if out is None:
+        out = np.empty_like(arr)
+    np.multiply(arr, scale, out=out)
+    if offset:
+        np.add(out, offset, out=out)
+    return out
+
+
+def convert_to_all(values, from_unit, category=None):
+    """Convert ``values`` from ``from_unit`` into every unit of its category.
+
+    Returns an array with one trailing axis ordered like ``category.units``:
+    shape ``(n_units,)`` for a scalar, ``(*values.shape, n_units)`` otherwise.
+    """
+    if category is None:
+        cat = UNIT_CATEGORIES.get(from_unit)
+        if cat is None:
+            raise ValueError(f"Unknown unit: {from_unit}")
+    else:
+        cat = get_category(category)
+    i = cat.index[from_unit]
+    scales, offsets = SCALES[cat.name][i], OFFSETS[cat.name][i]
+    return np.multiply.outer(_as_array(values), scales) + offsets
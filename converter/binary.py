@@ -0,0 +1,96 @@
+"""Memory-mapped conversion of raw binary numeric dumps.
+
+Input and output files are memory-mapped and converted one page-aligned
+block at a time, so only a block's worth of pages is touched at once and the
+array is never loaded whole::
+
+    python -m converter.binary counts.f8 counts_gb.f4 -f byte -t gigabyte --out-dtype float32
+    python -m converter.binary readings.f8 -f kilowatt_hour -t joule --inplace
+"""
+import argparse
+import mmap
+import os
+import sys
+
+import numpy as np
+
+from .batch import apply_coefficients
+from .fallback import coefficients
+
+DEFAULT_BLOCK_SIZE = 16 << 20  # bytes of input per block
+
+
+def _block_items(block_size, itemsize):
+    # Round the block down to whole pages (at least one) of input
+    pages = max(1, block_size // mmap.ALLOCATIONGRANULARITY)
+    return pages * mmap.ALLOCATIONGRANULARITY // itemsize
+
+
+def convert_binary(src, dst, from_unit, to_unit, dtype="float64", out_dtype=None,
+                   inplace=False, block_size=DEFAULT_BLOCK_SIZE):
+    """Convert every value of a raw binary array file; return the value count.
+
+    ``dtype`` describes the input (e.g. ``"float32"`` or ``"<f8"``) and
+    ``out_dtype`` the output, defaulting to ``dtype``. With ``inplace`` the
+    input file is overwritten and ``dst`` is ignored.
+    """
+    dtype = np.dtype(dtype)
+    out_dtype = np.dtype(out_dtype) if out_dtype is not None else dtype
+    if inplace and out_dtype != dtype:
+        raise ValueError("In-place conversion cannot change the dtype")
+    if dtype.kind != "f" or out_dtype.kind != "f":
+        raise ValueError("Binary conversion needs floating point input and output dtypes")
+    scale, offset = coefficients(from_unit, to_unit)
+    # Mapping dst for writing would truncate the input while it is being read
+    if not inplace and os.path.exists(dst) and os.path.samefile(src, dst):
+        raise ValueError(f"{dst} is the input file; use --inplace to overwrite it")
+
+    size = os.path.getsize(src)
+    if size % dtype.itemsize:
+        raise ValueError(f"{src} is {size} bytes, not a whole number of {dtype} values")
+    count = size // dtype.itemsize
+    if count == 0:
+        if not inplace:
+            open(dst, "wb").close()
+        return 0
+
+    source = np.memmap(src, dtype=dtype, mode="r+" if inplace else "r", shape=(count,))
+    target = source if inplace else np.memmap(dst, dtype=out_dtype, mode="w+", shape=(count,))
+    step = _block_items(block_size, dtype.itemsize)
+    try:
+        for start in range(0, count, step):
+            stop = min(start + step, count)
+            apply_coefficients(source[start:stop], scale, offset, out=target[start:stop])
+        target.flush()
+    finally:
+        del source, target
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m converter.binary",
+                                     description="Convert a raw binary array of values between units.")
+    parser.add_argument("input", help="raw binary input file")
+    parser.add_argument("output", nargs="?", help="raw binary output file (omit with --inplace)")
+    parser.add_argument("-f", "--from", dest="from_unit", required=True, help="source unit")
+    parser.add_argument("-t", "--to", dest="to_unit", required=True, help="target unit")
+    parser.add_argument("--dtype", default="float64", help="input dtype (default: float64)")
+    parser.add_argument("--out-dtype", help="output dtype (default: same as input)")
+    parser.add_argument("--inplace", action="store_true", help="overwrite the input file")
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE, help="bytes per block")
+    args = parser.parse_args(argv)
+    if (args.output is None) != args.inplace:
+        parser.error("give either an output file or --inplace")
+    try:
+        count = convert_binary(args.input, args.output, args.from_unit, args.to_unit,
+                               dtype=args.dtype, out_dtype=args.out_dtype,
+                               inplace=args.inplace, block_size=args.block_size)
+    except (ValueError, TypeError, OSError) as e:
+        print(f"Error in conversion: {e}", file=sys.stderr)
+        return 1
+    print(f"Converted {count} values", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
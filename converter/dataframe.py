@@ -0,0 +1,146 @@
+"""Columnar unit conversion for pandas and Arrow.
+
+Importing this module registers a ``units`` accessor on pandas Series and
+DataFrames::
+
+    import converter.dataframe  # noqa: F401
+
+    df["dist"].units.convert("mile", "kilometer")
+    df.units.convert(["dist", "elev"], "foot", "meter", inplace=True)
+
+Conversions are one vectorized multiply-add over the column's NumPy buffer,
+written back into that buffer with ``inplace=True``. The unit each column is
+in is recorded (``Series.attrs["unit"]``, ``DataFrame.attrs["units"]`` or the
+Arrow field metadata), so converting a column to the unit it is already in
+returns it unchanged.
+
+The unit is recorded on the object the accessor is called on. pandas drops
+``attrs`` when a Series is assigned into a frame, so
+``df["dist"] = df["dist"].units.convert(...)`` converts again every time it
+runs. Convert DataFrame columns through the frame accessor instead, which
+records them in ``df.attrs["units"]``::
+
+    df = df.units.convert("dist", "mile", "kilometer")
+    df = df.units.convert("dist", "mile", "kilometer")  # already kilometers: unchanged
+"""
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .batch import apply_coefficients
+from .fallback import coefficients
+
+UNIT_KEY = b"unit"
+
+
+def _check_unit(known, from_unit):
+    if known is not None and known != from_unit:
+        raise ValueError(f"Column is in {known}, not {from_unit}")
+
+
+def _convert_values(values, from_unit, to_unit, inplace):
+    scale, offset = coefficients(from_unit, to_unit)
+    if inplace:
+        if values.dtype.kind != "f" or not values.flags.writeable:
+            raise TypeError("In-place conversion needs a writeable float column")
+        return apply_coefficients(values, scale, offset, out=values)
+    return apply_coefficients(values, scale, offset)
+
+
+@pd.api.extensions.register_series_accessor("units")
+class UnitsSeriesAccessor:
+    def __init__(self, series):
+        self._series = series
+
+    @property
+    def unit(self):
+        """The unit this Series is known to be in, or ``None``."""
+        attrs = self._series.attrs
+        return attrs.get("unit") or attrs.get("units", {}).get(self._series.name)
+
+    def set(self, unit):
+        self._series.attrs["unit"] = unit
+        return self._series
+
+    def convert(self, from_unit, to_unit, inplace=False):
+        """Convert from ``from_unit`` to ``to_unit``; a no-op if already in ``to_unit``."""
+        known = self.unit
+        if known == to_unit:
+            return None if inplace else self._series
+        _check_unit(known, from_unit)
+        series = self._series
+        values = _convert_values(series.to_numpy(copy=False), from_unit, to_unit, inplace)
+        if inplace:
+            series.attrs["unit"] = to_unit
+            return None
+        result = pd.Series(values, index=series.index, name=series.name, copy=False)
+        result.attrs["unit"] = to_unit
+        return result
+
+    def to(self, to_unit, inplace=False):
+        """Convert from the recorded unit to ``to_unit``."""
+        if self.unit is None:
+            raise ValueError("Series has no recorded unit; use convert(from_unit, to_unit)")
+        return self.convert(self.unit, to_unit, inplace=inplace)
+
+
+@pd.api.extensions.register_dataframe_accessor("units")
+class UnitsDataFrameAccessor:
+    def __init__(self, df):
+        self._df = df
+
+    @property
+    def units(self):
+        """Mapping of column name to its recorded unit."""
+        return self._df.attrs.get("units", {})
+
+    def set(self, **units):
+        self._df.attrs["units"] = {**self.units, **units}
+        return self._df
+
+    def convert(self, columns, from_unit, to_unit, inplace=False):
+        """Convert ``columns`` (a name or list of names) between units.
+
+        Returns a new DataFrame sharing the unconverted columns, or ``None``
+        when ``inplace`` is set and the float columns are overwritten.
+        """
+        if isinstance(columns, str):
+            columns = [columns]
+        df = self._df if inplace else self._df.copy(deep=False)
+        units = dict(self.units)
+        for column in columns:
+            known = units.get(column)
+            if known == to_unit:
+                continue
+            _check_unit(known, from_unit)
+            values = self._df[column].to_numpy(copy=False)
+            if inplace and values.dtype.kind == "f" and values.flags.writeable:
+                _convert_values(values, from_unit, to_unit, inplace=True)
+            else:
+                df[column] = _convert_values(values, from_unit, to_unit, inplace=False)
+            units[column] = to_unit
+        df.attrs["units"] = units
+        return None if inplace else df
+
+
+def convert_arrow(array, from_unit, to_unit):
+    """Arrow compute-style kernel: ``array * scale + offset`` with nulls preserved."""
+    scale, offset = coefficients(from_unit, to_unit)
+    result = pc.multiply(pc.cast(array, pa.float64()), scale)
+    return pc.add(result, offset) if offset else result
+
+
+def convert_table_column(table, column, from_unit, to_unit):
+    """Return ``table`` with ``column`` converted and its field tagged with the unit."""
+    i = table.schema.get_field_index(column)
+    if i < 0:
+        raise ValueError(f"Column not found: {column}")
+    field = table.schema.field(i)
+    metadata = field.metadata or {}
+    known = metadata.get(UNIT_KEY)
+    if known is not None and known.decode() == to_unit:
+        return table
+    _check_unit(known.decode() if known is not None else None, from_unit)
+    converted = convert_arrow(table.column(i), from_unit, to_unit)
+    field = pa.field(field.name, pa.float64(), field.nullable, {**metadata, UNIT_KEY: to_unit.encode()})
+    return table.set_column(i, field, converted)
@@ -0,0 +1,285 @@
+"""Conversion engine shared by the Streamlit app, workers and tests.
+
+All factor tables and the category registry are built once at import time,
+so callers never pay for rebuilding them per conversion.
+
+Factors are the exact definitional values (international yard and pound, US
+liquid gallon, thermochemical calorie). Each category keeps them as
+``Fraction`` for exact mode and derives its float tables from those.
+"""
+from dataclasses import dataclass, field
+from decimal import Decimal
+from fractions import Fraction
+from functools import cached_property
+from typing import Dict, Optional, Tuple
+
+# Conversion to meters (base unit)
+LENGTH_TO_METER = {
+    "meter": 1,
+    "kilometer": 1000,
+    "centimeter": 0.01,
+    "millimeter": 0.001,
+    "mile": 1609.344,
+    "yard": 0.9144,
+    "foot": 0.3048,
+    "inch": 0.0254
+}
+
+# Conversion to kilograms (base unit)
+WEIGHT_TO_KG = {
+    "kilogram": 1,
+    "gram": 0.001,
+    "milligram": 0.000001,
+    "metric_ton": 1000,
+    "pound": 0.45359237,
+    "ounce": 0.028349523125
+}
+
+# Conversion to kelvin (base unit) as (scale, offset): kelvin = value * scale + offset
+TEMPERATURE_TO_KELVIN = {
+    "celsius": (Fraction(1), Fraction("273.15")),
+    "fahrenheit": (Fraction(5, 9), Fraction("273.15") - Fraction(160, 9)),
+    "kelvin": (Fraction(1), Fraction(0))
+}
+TEMPERATURE_UNITS = tuple(TEMPERATURE_TO_KELVIN)
+
+# Conversion to liters (base unit)
+VOLUME_TO_LITER = {
+    "liter": 1,
+    "milliliter": 0.001,
+    "cubic_meter": 1000,
+    "gallon": 3.785411784,
+    "quart": 0.946352946,
+    "pint": 0.473176473,
+    "cup": 0.2365882365,
+    "fluid_ounce": 0.0295735295625
+}
+
+# Conversion to square meters (base unit)
+AREA_TO_SQ_METER = {
+    "square_meter": 1,
+    "square_kilometer": 1000000,
+    "hectare": 10000,
+    "acre": 4046.8564224,
+    "square_foot": 0.09290304,
+    "square_inch": 0.00064516
+}
+
+# Conversion to seconds (base unit)
+TIME_TO_SECOND = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "week": 604800,
+    "month": 2629746,  # Average month (30.44 days)
+    "year": 31556952   # Average year (365.24 days)
+}
+
+# Conversion to joules (base unit)
+ENERGY_TO_JOULE = {
+    "joule": 1,
+    "kilojoule": 1000,
+    "calorie": 4.184,
+    "kilocalorie": 4184,
+    "watt_hour": 3600,
+    "kilowatt_hour": 3600000,
+    "electron_volt": 1.602176634e-19
+}
+
+# Conversion to bits (base unit)
+DIGITAL_TO_BIT = {
+    "bit": 1,
+    "byte": 8,
+    "kilobyte": 8 * 1024,
+    "megabyte": 8 * 1024**2,
+    "gigabyte": 8 * 1024**3,
+    "terabyte": 8 * 1024**4
+}
+
+
+@dataclass(frozen=True)
+class Category:
+    name: str
+    icon: str
+    units: Tuple[str, ...]
+    factors: Optional[Dict[str, float]] = None  # None for affine categories
+    affine_factors: Optional[Dict[str, Tuple[Fraction, Fraction]]] = None
+    info: str = ""
+
+    # Unit names interned to small integer indices, the dense from x to matrix
+    # of float (scale, offset) pairs and the same rows keyed by unit names
+    # (``pairs[from_unit][to_unit]``), all built once when the category
+    # loads. The exact Fraction matrix is only needed by exact mode, so it is
+    # built on first use.
+    index: Dict[str, int] = field(init=False, repr=False, compare=False)
+    matrix: Tuple[Tuple[Tuple[float, float], ...], ...] = field(init=False, repr=False, compare=False)
+    pairs: Dict[str, Dict[str, Tuple[float, float]]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "index", {unit: i for i, unit in enumerate(self.units)})
+        object.__setattr__(self, "matrix", self._float_matrix())
+        object.__setattr__(self, "pairs", {
+            from_unit: dict(zip(self.units, row)) for from_unit, row in zip(self.units, self.matrix)
+        })
+
+    def _float_matrix(self):
+        # Work on integer numerators and denominators: int / int is correctly
+        # rounded, so each pair is rounded once, like float(Fraction), without
+        # paying for Fraction arithmetic on every pair
+        factors = [self.base_factors(unit) for unit in self.units]
+        ints = [(s.numerator, s.denominator, o.numerator, o.denominator) for s, o in factors]
+        matrix = []
+        for a, b, p, q in ints:
+            row = []
+            for c, d, r, t in ints:
+                # scale = (a/b) / (c/d); offset = (p/q - r/t) / (c/d)
+                offset = (p * t - r * q) * d / (q * t * c) if p * t != r * q else 0.0
+                row.append((a * d / (b * c), offset))
+            matrix.append(tuple(row))
+        return tuple(matrix)
+
+    @cached_property
+    def exact_matrix(self):
+        return tuple(
+            tuple(self._pair(from_unit, to_unit) for to_unit in self.units)
+            for from_unit in self.units
+        )
+
+    @cached_property
+    def base_unit(self):
+        """The unit whose factor to the base is exactly 1."""
+        return next(u for u in self.units if self.base_factors(u) == (1, 0))
+
+    @property
+    def label(self):
+        return f"{self.icon} {self.name}"
+
+    def base_factors(self, unit):
+        """Return the exact ``(scale, offset)`` of ``unit`` to the base unit."""
+        if self.factors is not None:
+            return _exact(self.factors[unit]), Fraction(0)
+        return self.affine_factors[unit]
+
+    def _pair(self, from_unit, to_unit):
+        # Compose through the base unit exactly
+        from_scale, from_offset = self.base_factors(from_unit)
+        to_scale, to_offset = self.base_factors(to_unit)
+        return from_scale / to_scale, (from_offset - to_offset) / to_scale
+
+    def coefficients(self, from_unit, to_unit):
+        """Return ``(scale, offset)`` so that ``result = value * scale + offset``."""
+        return self.matrix[self.index[from_unit]][self.index[to_unit]]
+
+    def convert(self, value, from_unit, to_unit):
+        scale, offset = self.pairs[from_unit][to_unit]
+        return value * scale + offset
+
+    def convert_index(self, value, from_index, to_index):
+        scale, offset = self.matrix[from_index][to_index]
+        return value * scale + offset
+
+    def convert_exact(self, value, from_unit, to_unit):
+        """Convert without rounding.
+
+        ``value`` may be an int, float, str, ``Fraction`` or ``Decimal``. The
+        result is a ``Fraction``, or a ``Decimal`` rounded once in the current
+        context when ``value`` is a ``Decimal``.
+        """
+        scale, offset = self.exact_matrix[self.index[from_unit]][self.index[to_unit]]
+        result = (value if isinstance(value, Fraction) else Fraction(value)) * scale
+        if offset:
+            result += offset
+        if isinstance(value, Decimal):
+            return Decimal(result.numerator) / Decimal(result.denominator)
+        return result
+
+
+def _exact(factor):
+    # Float literals in the tables are the definitional decimal values, so
+    # their shortest repr gives back the exact factor
+    return Fraction(repr(factor)) if isinstance(factor, float) else Fraction(factor)
+
+
+def _category(name, icon, factors):
+    return Category(name, icon, tuple(factors), factors)
+
+
+# Registry of every supported category, keyed by its plain name
+CATEGORIES = {
+    c.name: c for c in (
+        _category("Length", "📏", LENGTH_TO_METER),
+        _category("Weight/Mass", "⚖️", WEIGHT_TO_KG),
+        Category("Temperature", "🌡️", TEMPERATURE_UNITS, affine_factors=TEMPERATURE_TO_KELVIN),
+        _category("Volume", "🧪", VOLUME_TO_LITER),
+        _category("Area", "📐", AREA_TO_SQ_METER),
+        _category("Time", "⏱️", TIME_TO_SECOND),
+        _category("Energy", "🔌", ENERGY_TO_JOULE),
+        _category("Digital", "💻", DIGITAL_TO_BIT),
+    )
+}
+
+# Reverse index so callers can convert by unit name alone
+UNIT_CATEGORIES = {unit: c for c in CATEGORIES.values() for unit in c.units}
+
+# Stable small integer id per category, in registration order
+CATEGORY_IDS = {name: i for i, name in enumerate(CATEGORIES)}
+
+convert_length = CATEGORIES["Length"].convert
+convert_weight = CATEGORIES["Weight/Mass"].convert
+convert_temperature = CATEGORIES["Temperature"].convert
+convert_volume = CATEGORIES["Volume"].convert
+convert_area = CATEGORIES["Area"].convert
+convert_time = CATEGORIES["Time"].convert
+convert_energy = CATEGORIES["Energy"].convert
+convert_digital = CATEGORIES["Digital"].convert
+
+
+def register_category(category):
+    """Add a category to the registry; its name and unit names must be new."""
+    if category.name in CATEGORIES:
+        raise ValueError(f"Category already registered: {category.name}")
+    clashes = [unit for unit in category.units if unit in UNIT_CATEGORIES]
+    if clashes:
+        raise ValueError(f"Units already registered: {', '.join(clashes)}")
+    CATEGORIES[category.name] = category
+    CATEGORY_IDS[category.name] = len(CATEGORY_IDS)
+    UNIT_CATEGORIES.update((unit, category) for unit in category.units)
+    return category
+
+
+def get_category(name):
+    try:
+        return CATEGORIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown conversion category: {name}") from None
+
+
+def convert(category, value, from_unit, to_unit, exact=False):
+    """Convert ``value`` between two units of the named category.
+
+    With ``exact=True`` the result is computed without rounding; see
+    :meth:`Category.convert_exact`.
+    """
+    if exact:
+        return get_category(category).convert_exact(value, from_unit, to_unit)
+    # Hot path: plain dict lookups on the (cached) hashes of the three names,
+    # with no helper calls; errors are reported by the slow path
+    try:
+        scale, offset = CATEGORIES[category].pairs[from_unit][to_unit]
+    except KeyError:
+        return get_category(category).convert(value, from_unit, to_unit)
+    return value * scale + offset
+
+
+def find_category(from_unit, to_unit):
+    """Return the category containing both units."""
+    category = UNIT_CATEGORIES.get(from_unit)
+    if category is None:
+        raise ValueError(f"Unknown unit: {from_unit}")
+    if to_unit not in UNIT_CATEGORIES:
+        raise ValueError(f"Unknown unit: {to_unit}")
+    if UNIT_CATEGORIES[to_unit] is not category:
+        raise ValueError(f"Cannot convert {from_unit} to {to_unit}: "
+                         f"{category.name} vs {UNIT_CATEGORIES[to_unit].name}")
+    return category
@@ -0,0 +1,108 @@
+"""Pint-backed fallback for unit expressions outside the native tables.
+
+The native category tables are always tried first, then the unit graph for
+derived expressions built from native units (see :mod:`converter.graph`).
+pint is only imported, and its ``UnitRegistry`` only built, the first time a
+unit neither of them covers is requested; the registry is then shared by every caller in the process.
+Native unit names keep the engine's definitions on either side of a pint
+conversion, so ``kilobyte`` is 8192 bits whatever it is converted to.
+Resolved ``(scale, offset)`` pairs are memoized, so repeated queries never go
+back through pint's parser.
+"""
+import re
+import threading
+from fractions import Fraction
+from functools import lru_cache
+
+from . import graph
+from .engine import UNIT_CATEGORIES
+
+RESOLVE_CACHE_SIZE = 4096
+
+# Native base units pint spells differently
+PINT_NAMES = {"square_meter": "meter**2"}
+
+_NAME = re.compile(r"\b[A-Za-z_]\w*")
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    """Return the process-wide pint ``UnitRegistry``, building it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                import pint
+                # Exact magnitudes, so resolved factors are rounded only once
+                _registry = pint.UnitRegistry(non_int_type=Fraction)
+    return _registry
+
+
+def _native_expression(match):
+    # A multiplicative native unit inside a pint expression, as its exact
+    # factor times a base unit pint knows
+    unit = match.group()
+    category = UNIT_CATEGORIES.get(unit)
+    if category is None or category.factors is None:
+        return unit
+    scale = category.base_factors(unit)[0]
+    base = PINT_NAMES.get(category.base_unit, category.base_unit)
+    return f"({scale.numerator}/{scale.denominator}*{base})"
+
+
+def _pint_side(ureg, unit):
+    # Return (scale, offset, quantity) so that a value in ``unit`` is
+    # ``value * scale + offset`` of ``quantity``. Native names always keep
+    # the engine's definition, even when the other side is a pint unit.
+    category = UNIT_CATEGORIES.get(unit)
+    if category is not None and category.factors is None:
+        scale, offset = category.base_factors(unit)
+        return scale, offset, ureg.parse_expression(PINT_NAMES.get(category.base_unit, category.base_unit))
+    return 1, 0, ureg.parse_expression(_NAME.sub(_native_expression, unit))
+
+
+@lru_cache(maxsize=RESOLVE_CACHE_SIZE)
+def _pint_coefficients(from_unit, to_unit):
+    ureg = get_registry()
+    try:
+        from_scale, from_offset, source = _pint_side(ureg, from_unit)
+        to_scale, to_offset, target = _pint_side(ureg, to_unit)
+        if source._is_multiplicative and target._is_multiplicative:
+            scale, offset = source.to(target.units).magnitude / target.magnitude, 0
+        else:
+            # Offset units such as degF: the registry is exact, so the affine
+            # map from two points has no rounding error
+            zero = ureg.Quantity(Fraction(0), source.units).to(target.units).magnitude
+            scale = ureg.Quantity(Fraction(1), source.units).to(target.units).magnitude - zero
+            offset = zero
+        scale, offset = Fraction(scale), Fraction(offset)
+    except Exception as e:
+        # pint's parser and evaluator can raise nearly anything on bad input
+        # (TokenError, ZeroDivisionError, DimensionalityError, ...)
+        raise ValueError(f"Cannot convert {from_unit} to {to_unit}: {e}") from None
+    # Compose: unit -> source quantity -> target quantity -> unit
+    total_offset = (from_offset * scale + offset - to_offset) / to_scale
+    return float(from_scale * scale / to_scale), float(total_offset)
+
+
+def coefficients(from_unit, to_unit):
+    """Return ``(scale, offset)`` for any pair of native units or pint expressions."""
+    category = UNIT_CATEGORIES.get(from_unit)
+    if category is not None and UNIT_CATEGORIES.get(to_unit) is category:
+        return category.coefficients(from_unit, to_unit)
+    try:
+        return graph.derived_coefficients(from_unit, to_unit)
+    except ValueError:
+        return _pint_coefficients(from_unit, to_unit)
+
+
+def convert_units(value, from_unit, to_unit):
+    """Convert ``value`` between native units or arbitrary pint expressions."""
+    scale, offset = coefficients(from_unit, to_unit)
+    return value * scale + offset
+
+
+def cache_info():
+    return _pint_coefficients.cache_info()
@@ -0,0 +1,201 @@
+"""Unit graph for chained and derived (compound) unit conversions.
+
+Units are nodes and each edge is an exact affine map between two of them.
+The native category tables supply the edges to each category's base unit;
+:data:`DEFINITIONS` then express some of those bases, and a few extra named
+units, as products of others, so expressions such as ``kilowatt_hour/day``,
+``gigabyte/hour`` or ``foot^2`` reduce to common base units::
+
+    >>> convert_derived(24, "kilowatt_hour/day", "watt")
+    1000.0
+
+The first lookup collapses every connected component of the graph to one
+``(scale, offset)`` pair per unit relative to the component root; resolved
+expressions and pairs are kept in bounded LRU caches, so repeated conversions
+are dict lookups.
+"""
+import re
+import threading
+from collections import defaultdict, deque
+from fractions import Fraction
+from functools import lru_cache
+
+from .engine import CATEGORIES
+
+# Named units defined as a scale times a product of other units
+DEFINITIONS = {
+    "square_meter": (1, "meter^2"),
+    "liter": (Fraction(1, 1000), "meter^3"),
+    "joule": (1, "kilogram*meter^2/second^2"),
+    "watt": (1, "joule/second"),
+}
+
+# Extra edges for derived units that have no native category
+EXTRA_EDGES = [
+    ("kilowatt", "watt", 1000),
+    ("megawatt", "watt", 1000000),
+]
+
+RESOLVE_CACHE_SIZE = 4096
+
+# Largest sum of absolute exponents in one expression: exact scales grow with
+# the power, so mile^100000 would take seconds and megabytes to resolve
+MAX_POWER = 12
+
+_TERM = re.compile(r"^([A-Za-z_]+)(?:\^(-?\d+))?$")
+
+
+class UnitGraph:
+    def __init__(self):
+        self._edges = defaultdict(list)
+        self._definitions = {}
+        self._bases = set()
+        self._lock = threading.Lock()
+        self._invalidate()
+
+    def _invalidate(self):
+        self._roots = None
+        self._resolved = lru_cache(maxsize=RESOLVE_CACHE_SIZE)(self._resolve)
+        self._pairs = lru_cache(maxsize=RESOLVE_CACHE_SIZE)(self._coefficients)
+
+    def add_edge(self, unit, target, scale, offset=0):
+        """Declare ``1 unit`` as ``scale + offset`` in ``target``: target = unit * scale + offset."""
+        scale, offset = Fraction(scale), Fraction(offset)
+        self._edges[unit].append((target, scale, offset))
+        self._edges[target].append((unit, 1 / scale, -offset / scale))
+        self._invalidate()
+
+    def add_base(self, unit):
+        """Prefer ``unit`` as the root of its component, e.g. kelvin over celsius."""
+        self._edges.setdefault(unit, [])
+        self._bases.add(unit)
+        self._invalidate()
+
+    def add_category(self, category):
+        """Add an edge from every unit of an engine category to its base unit."""
+        base = category.base_unit
+        self.add_base(base)
+        for unit in category.units:
+            if unit != base:
+                self.add_edge(unit, base, *category.base_factors(unit))
+
+    def define(self, unit, expression, scale=1):
+        """Declare ``unit`` as ``scale`` times a compound ``expression``."""
+        self._edges.setdefault(unit, [])
+        self._definitions[unit] = (Fraction(scale), expression)
+        self._invalidate()
+
+    def _collapse(self):
+        # Map every unit to (root, scale, offset) with root = unit * scale + offset
+        roots = {}
+        for start in self._edges:
+            if start in roots:
+                continue
+            component, queue = {start}, deque([start])
+            while queue:
+                for target, _, _ in self._edges[queue.popleft()]:
+                    if target not in component:
+                        component.add(target)
+                        queue.append(target)
+            # Root each component at a defined unit, else at a declared base
+            root = next((u for u in component if u in self._definitions),
+                        next((u for u in component if u in self._bases), start))
+            roots[root] = (root, Fraction(1), Fraction(0))
+            queue = deque([root])
+            while queue:
+                unit = queue.popleft()
+                _, to_root, to_root_offset = roots[unit]
+                for target, scale, offset in self._edges[unit]:
+                    if target not in roots:
+                        # target = unit * scale + offset, so compose its inverse with unit -> root
+                        roots[target] = (root, to_root / scale, to_root_offset - to_root * offset / scale)
+                        queue.append(target)
+        self._roots = roots
+
+    def _unit(self, unit, seen=()):
+        """Return ``(scale, offset, dimensions)`` for one named unit."""
+        if self._roots is None:
+            self._collapse()
+        try:
+            root, scale, offset = self._roots[unit]
+        except KeyError:
+            raise ValueError(f"Unknown unit: {unit}") from None
+        if root not in self._definitions:
+            return scale, offset, {root: 1}
+        if root in seen:
+            raise ValueError(f"Circular definition of {root}")
+        factor, expression = self._definitions[root]
+        base_scale, base_offset, dimensions = self._expression(expression, seen + (root,))
+        return scale * factor * base_scale, offset, dimensions
+
+    def _expression(self, expression, seen=()):
+        total, offset, dimensions = Fraction(1), Fraction(0), defaultdict(int)
+        terms = re.split(r"([*/])", expression.replace(" ", ""))
+        compound = len(terms) > 1
+        sign, degree = 1, 0
+        for i, term in enumerate(terms):
+            if i % 2:
+                sign = 1 if term == "*" else -1
+                continue
+            match = _TERM.match(term)
+            if match is None:
+                raise ValueError(f"Cannot parse unit expression: {expression!r}")
+            power = sign * int(match[2] or 1)
+            degree += abs(power)
+            if degree > MAX_POWER:
+                raise ValueError(f"Unit expression exceeds total power {MAX_POWER}: {expression!r}")
+            scale, unit_offset, unit_dimensions = self._unit(match[1], seen)
+            if unit_offset and (compound or power != 1):
+                raise ValueError(f"Affine unit {match[1]} cannot be used in {expression!r}")
+            offset = unit_offset
+            total *= scale ** power
+            for base, exponent in unit_dimensions.items():
+                dimensions[base] += exponent * power
+        return total, offset, {b: e for b, e in dimensions.items() if e}
+
+    def _resolve(self, expression):
+        with self._lock:
+            return self._expression(expression)
+
+    def resolve(self, expression):
+        """Return the exact ``(scale, offset, dimensions)`` of ``expression`` in base units."""
+        return self._resolved(expression)
+
+    def _coefficients(self, from_unit, to_unit):
+        from_scale, from_offset, from_dims = self.resolve(from_unit)
+        to_scale, to_offset, to_dims = self.resolve(to_unit)
+        if from_dims != to_dims:
+            raise ValueError(f"Cannot convert {from_unit} to {to_unit}: incompatible dimensions")
+        return float(from_scale / to_scale), float((from_offset - to_offset) / to_scale)
+
+    def coefficients(self, from_unit, to_unit):
+        """Return float ``(scale, offset)`` so that ``result = value * scale + offset``."""
+        return self._pairs(from_unit, to_unit)
+
+    def convert(self, value, from_unit, to_unit):
+        scale, offset = self.coefficients(from_unit, to_unit)
+        return value * scale + offset
+
+
+def build_graph():
+    """Return a graph of every native unit plus the derived definitions."""
+    graph = UnitGraph()
+    for category in CATEGORIES.values():
+        graph.add_category(category)
+    for unit, (scale, expression) in DEFINITIONS.items():
+        graph.define(unit, expression, scale)
+    for unit, target, scale in EXTRA_EDGES:
+        graph.add_edge(unit, target, scale)
+    return graph
+
+
+GRAPH = build_graph()
+
+
+def derived_coefficients(from_unit, to_unit):
+    return GRAPH.coefficients(from_unit, to_unit)
+
+
+def convert_derived(value, from_unit, to_unit):
+    """Convert between native, derived or compound unit expressions."""
+    return GRAPH.convert(value, from_unit, to_unit)
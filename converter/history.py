@@ -0,0 +1,101 @@
+"""Bounded conversion history backed by typed arrays.
+
+Each entry costs 22 bytes: the value and result as doubles plus two bytes each
+for the category, source and target unit indices, which leaves room for unit
+packs with hundreds of units. Storage is allocated once
+up front and reused as a ring buffer, so a long session never grows it.
+"""
+import csv
+import io
+from array import array
+
+from .engine import CATEGORIES, CATEGORY_IDS, UNIT_CATEGORIES
+
+DEFAULT_CAPACITY = 500
+
+CSV_HEADER = ("value", "category", "from_unit", "to_unit", "result")
+
+
+class ConversionHistory:
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError(f"History capacity must be at least 1, not {capacity}")
+        self.capacity = capacity
+        self._values = array("d", bytes(8 * capacity))
+        self._results = array("d", bytes(8 * capacity))
+        self._categories = array("H", bytes(2 * capacity))
+        self._from = array("H", bytes(2 * capacity))
+        self._to = array("H", bytes(2 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def _order(self):
+        # Buffer positions from oldest to newest
+        start = (self._next - self._size) % self.capacity
+        return [(start + i) % self.capacity for i in range(self._size)]
+
+    def append(self, category, value, from_unit, to_unit, result):
+        """Record a conversion; repeats of the latest entry are skipped.
+
+        Returns whether an entry was added. Once full, the oldest entry is
+        overwritten.
+        """
+        cat = CATEGORIES[category]
+        entry = (CATEGORY_IDS[category], cat.index[from_unit], cat.index[to_unit], value)
+        if self._size:
+            last = (self._next - 1) % self.capacity
+            if entry == (self._categories[last], self._from[last], self._to[last], self._values[last]):
+                return False
+        i = self._next
+        self._categories[i], self._from[i], self._to[i], self._values[i] = entry
+        self._results[i] = result
+        self._next = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        return True
+
+    def clear(self):
+        self._next = self._size = 0
+
+    def records(self):
+        """Return ``(value, category, from_unit, to_unit, result)`` tuples, oldest first."""
+        # Category ids follow registration order
+        categories = tuple(CATEGORIES.values())
+        records = []
+        for i in self._order():
+            cat = categories[self._categories[i]]
+            records.append((self._values[i], cat.name, cat.units[self._from[i]],
+                            cat.units[self._to[i]], self._results[i]))
+        return records
+
+    def to_csv(self):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(self.records())
+        return buffer.getvalue()
+
+    def rerun(self, to_unit):
+        """Convert every entry to ``to_unit`` in one batch, oldest first.
+
+        Entries from other categories than ``to_unit``'s come back as NaN.
+        """
+        import numpy as np
+
+        from .batch import OFFSETS, SCALES
+
+        cat = UNIT_CATEGORIES.get(to_unit)
+        if cat is None:
+            raise ValueError(f"Unknown unit: {to_unit}")
+        order = np.array(self._order(), dtype=np.intp)
+        values = np.frombuffer(self._values, dtype=np.float64)[order]
+        froms = np.frombuffer(self._from, dtype=np.uint16)[order]
+        mask = np.frombuffer(self._categories, dtype=np.uint16)[order] == CATEGORY_IDS[cat.name]
+
+        j = cat.index[to_unit]
+        results = np.full(len(order), np.nan)
+        rows = froms[mask]
+        results[mask] = values[mask] * SCALES[cat.name][rows, j] + OFFSETS[cat.name][rows, j]
+        return results
@@ -0,0 +1,226 @@
+"""Opt-in instrumentation for conversions and Streamlit reruns.
+
+Disabled by default; when off, every entry point returns immediately or hands
+back a shared no-op context manager. Enable with ``CONVERTER_METRICS=1`` (or
+:func:`enable`). Data is exposed in Prometheus text format by
+:func:`render_prometheus`, over HTTP on ``CONVERTER_METRICS_PORT`` via
+:func:`serve_from_env` (localhost only unless ``CONVERTER_METRICS_HOST`` is
+set), and to any callables registered with :func:`add_hook`, which receive
+``(event, category, seconds, error)``.
+"""
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+CONVERSION_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2)
+RERUN_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+ENABLED = os.environ.get("CONVERTER_METRICS", "") not in ("", "0")
+
+_NULL = nullcontext()
+_lock = threading.Lock()
+_hooks = []
+_server = None
+_server_error = None
+
+log = logging.getLogger(__name__)
+
+
+class Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        i = 0
+        for bound in self.bounds:
+            if value <= bound:
+                break
+            i += 1
+        self.counts[i] += 1
+        self.sum += value
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+
+calls = {}
+errors = {}
+conversion_seconds = {}
+rerun_seconds = Histogram(RERUN_BUCKETS)
+
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    global ENABLED
+    ENABLED = False
+
+
+def reset():
+    global rerun_seconds
+    with _lock:
+        calls.clear()
+        errors.clear()
+        conversion_seconds.clear()
+        rerun_seconds = Histogram(RERUN_BUCKETS)
+
+
+def add_hook(hook):
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    _hooks.remove(hook)
+
+
+def _record_conversion(category, seconds, error):
+    with _lock:
+        calls[category] = calls.get(category, 0) + 1
+        if error is not None:
+            errors[category] = errors.get(category, 0) + 1
+        histogram = conversion_seconds.get(category)
+        if histogram is None:
+            histogram = conversion_seconds[category] = Histogram(CONVERSION_BUCKETS)
+        histogram.observe(seconds)
+    for hook in _hooks:
+        hook("conversion", category, seconds, error)
+
+
+@contextmanager
+def _track(category):
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        _record_conversion(category, time.perf_counter() - start, e)
+        raise
+    _record_conversion(category, time.perf_counter() - start, None)
+
+
+def track_conversion(category):
+    """Context manager timing one conversion and counting errors it raises."""
+    return _track(category) if ENABLED else _NULL
+
+
+def start_rerun():
+    return time.perf_counter() if ENABLED else None
+
+
+def end_rerun(started):
+    if started is None:
+        return
+    seconds = time.perf_counter() - started
+    with _lock:
+        rerun_seconds.observe(seconds)
+    for hook in _hooks:
+        hook("rerun", None, seconds, None)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _histogram_lines(name, histogram, **labels):
+    cumulative = 0
+    for bound, count in zip(histogram.bounds + (float("inf"),), histogram.counts):
+        cumulative += count
+        le = "+Inf" if bound == float("inf") else repr(bound)
+        yield f"{name}_bucket{_labels(**labels, le=le)} {cumulative}"
+    yield f"{name}_sum{_labels(**labels)} {histogram.sum!r}"
+    yield f"{name}_count{_labels(**labels)} {cumulative}"
+
+
+def render_prometheus():
+    """Return all metrics in the Prometheus text exposition format."""
+    with _lock:
+        lines = [
+            "# HELP converter_conversions_total Conversions performed, by category.",
+            "# TYPE converter_conversions_total counter",
+        ]
+        lines += [f"converter_conversions_total{_labels(category=c)} {n}" for c, n in calls.items()]
+        lines += [
+            "# HELP converter_conversion_errors_total Conversions that raised, by category.",
+            "# TYPE converter_conversion_errors_total counter",
+        ]
+        lines += [f"converter_conversion_errors_total{_labels(category=c)} {n}" for c, n in errors.items()]
+        lines += [
+            "# HELP converter_conversion_seconds Conversion latency, by category.",
+            "# TYPE converter_conversion_seconds histogram",
+        ]
+        for category, histogram in conversion_seconds.items():
+            lines += _histogram_lines("converter_conversion_seconds", histogram, category=category)
+        lines += [
+            "# HELP converter_rerun_seconds Wall time of full Streamlit script reruns.",
+            "# TYPE converter_rerun_seconds histogram",
+        ]
+        lines += _histogram_lines("converter_rerun_seconds", rerun_seconds)
+    return "\n".join(lines) + "\n"
+
+
+def _handler():
+    # http.server is only imported when the endpoint is actually started
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return MetricsHandler
+
+
+def start_http_server(port, host="127.0.0.1"):
+    """Serve ``/metrics`` from a daemon thread; safe to call on every rerun.
+
+    Only local clients can connect unless a wider ``host`` such as
+    ``"0.0.0.0"`` is passed.
+    """
+    global _server
+    with _lock:
+        if _server is None:
+            from http.server import ThreadingHTTPServer
+            _server = ThreadingHTTPServer((host, port), _handler())
+            threading.Thread(target=_server.serve_forever, daemon=True).start()
+    return _server
+
+
+def serve_from_env():
+    """Start the metrics endpoint if enabled and ``CONVERTER_METRICS_PORT`` is set.
+
+    It listens on ``CONVERTER_METRICS_HOST``, by default ``127.0.0.1``.
+
+    If the endpoint cannot start (say the port is taken by another app
+    process), the failure is logged once and later calls do nothing.
+    """
+    global _server_error
+    port = os.environ.get("CONVERTER_METRICS_PORT")
+    if ENABLED and port and _server is None and _server_error is None:
+        try:
+            start_http_server(int(port), os.environ.get("CONVERTER_METRICS_HOST", "127.0.0.1"))
+        except (OSError, ValueError) as e:
+            _server_error = e
+            log.warning("Metrics endpoint not started on port %s: %s", port, e)
@@ -0,0 +1,237 @@
+"""Unit packs: extra categories loaded from TOML or JSON files.
+
+A pack declares one or more categories, each with a base unit and the factor
+of every unit to it. Factors may be numbers or strings (``"133.322387415"``
+or ``"5/9"``) and are kept exact; a unit with an offset is given as a table::
+
+    [[category]]
+    name = "Pressure"
+    icon = "🧭"
+    info = "Convert between pascals, bars and torr."
+    base = "pascal"
+
+    [category.units]
+    pascal = 1
+    bar = 100000
+    torr = "101325/760"
+
+    [category.aliases]
+    torr = ["torrs"]
+
+Set ``CONVERTER_PACKS`` to pack files or directories (separated like
+``PATH``) to load them when :mod:`converter` is imported::
+
+    CONVERTER_PACKS=packs streamlit run app.py
+
+Each pack is validated and compiled to integer factor tables once; the
+compiled form is cached next to it in ``__pycache__/<name>.unitpack`` and
+reused until the pack file changes, so later starts skip parsing and
+validation.
+"""
+import json
+import marshal
+import os
+import re
+from fractions import Fraction
+from pathlib import Path
+
+from . import query
+from .engine import CATEGORIES, UNIT_CATEGORIES, Category, register_category
+from .graph import GRAPH
+
+PACK_SUFFIXES = (".toml", ".json")
+CACHE_SUFFIX = ".unitpack"
+CACHE_VERSION = 1
+DEFAULT_ICON = "📦"
+
+_UNIT_NAME = re.compile(r"^[a-z][a-z0-9_]*$")
+
+
+class PackError(ValueError):
+    """A unit pack could not be read or failed validation."""
+
+
+def _parse(path):
+    try:
+        if path.suffix == ".toml":
+            import tomllib
+            with open(path, "rb") as f:
+                return tomllib.load(f)
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        raise PackError(f"{path}: {e}") from None
+
+
+def _fraction(value, where):
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise PackError(f"{where}: factor must be a number or string, not {value!r}")
+    try:
+        # Floats go through their shortest repr, like the native tables
+        return Fraction(repr(value) if isinstance(value, float) else value)
+    except (ValueError, ZeroDivisionError):
+        raise PackError(f"{where}: invalid factor {value!r}") from None
+
+
+def _unit_factors(value, where):
+    if isinstance(value, dict):
+        unknown = set(value) - {"scale", "offset"}
+        if unknown or "scale" not in value:
+            raise PackError(f"{where}: expected a table with 'scale' and optional 'offset'")
+        scale = _fraction(value["scale"], where)
+        offset = _fraction(value.get("offset", 0), where)
+    else:
+        scale, offset = _fraction(value, where), Fraction(0)
+    if scale <= 0:
+        raise PackError(f"{where}: scale must be positive")
+    return scale, offset
+
+
+def _compile_category(spec, where):
+    if not isinstance(spec, dict):
+        raise PackError(f"{where}: expected a table")
+    name = spec.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise PackError(f"{where}: missing category name")
+    where = f"{where} ({name})"
+    icon, info = spec.get("icon", DEFAULT_ICON), spec.get("info", "")
+    if not isinstance(icon, str) or not isinstance(info, str):
+        raise PackError(f"{where}: 'icon' and 'info' must be strings")
+    units = spec.get("units")
+    if not isinstance(units, dict) or not units:
+        raise PackError(f"{where}: 'units' must be a non-empty table")
+
+    factors = []
+    for unit, value in units.items():
+        if not _UNIT_NAME.match(unit):
+            raise PackError(f"{where}: invalid unit name {unit!r}")
+        scale, offset = _unit_factors(value, f"{where} {unit}")
+        factors.append((scale.numerator, scale.denominator, offset.numerator, offset.denominator))
+
+    base = spec.get("base")
+    if base is not None and base not in units:
+        raise PackError(f"{where}: base unit {base!r} is not one of its units")
+    bases = [unit for unit, f in zip(units, factors) if f[:3] == (1, 1, 0)]
+    if base is not None and base not in bases or not bases:
+        raise PackError(f"{where}: the base unit must have a factor of exactly 1")
+
+    alias_specs = spec.get("aliases", {})
+    if not isinstance(alias_specs, dict):
+        raise PackError(f"{where}: 'aliases' must be a table")
+    aliases = []
+    for unit, spellings in alias_specs.items():
+        if unit not in units:
+            raise PackError(f"{where}: aliases for unknown unit {unit!r}")
+        if isinstance(spellings, str):
+            spellings = [spellings]
+        if not isinstance(spellings, list) or not all(isinstance(a, str) for a in spellings):
+            raise PackError(f"{where}: aliases of {unit} must be strings")
+        aliases.extend((query._normalize_unit(alias), unit) for alias in spellings)
+    return name, icon, info, tuple(units), tuple(factors), tuple(aliases)
+
+
+def compile_pack(path):
+    """Parse and validate a pack file into its compiled, marshal-able form."""
+    path = Path(path)
+    if path.suffix not in PACK_SUFFIXES:
+        raise PackError(f"{path}: unit packs must be {' or '.join(PACK_SUFFIXES)} files")
+    pack = _parse(path)
+    specs = pack.get("category") if isinstance(pack, dict) else None
+    if not isinstance(specs, list) or not specs:
+        raise PackError(f"{path}: expected a list of categories under 'category'")
+    return tuple(_compile_category(spec, f"{path} category {i + 1}") for i, spec in enumerate(specs))
+
+
+def _cache_path(path):
+    return path.parent / "__pycache__" / (path.name + CACHE_SUFFIX)
+
+
+def read_pack(path):
+    """Return the compiled form of a pack, from its cached index when current."""
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError as e:
+        raise PackError(f"{path}: {e}") from None
+    key = (CACHE_VERSION, stat.st_size, stat.st_mtime_ns)
+    cache = _cache_path(path)
+    try:
+        with open(cache, "rb") as f:
+            cached_key, compiled = marshal.load(f)
+        if cached_key == key:
+            return compiled
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    compiled = compile_pack(path)
+    # The cache is only an optimization: a read-only pack directory just
+    # means the pack is parsed on every start
+    try:
+        cache.parent.mkdir(exist_ok=True)
+        tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            marshal.dump((key, compiled), f)
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+    return compiled
+
+
+def _build(name, icon, info, units, factors):
+    pairs = [(Fraction(n, d), Fraction(on, od)) for n, d, on, od in factors]
+    if any(offset for _, offset in pairs):
+        return Category(name, icon, units, affine_factors=dict(zip(units, pairs)), info=info)
+    return Category(name, icon, units, {unit: scale for unit, (scale, _) in zip(units, pairs)}, info=info)
+
+
+def _check_clashes(compiled, where):
+    names, spellings = set(), {}
+    for name, _, _, units, _, _ in compiled:
+        if name in CATEGORIES or name in names:
+            raise PackError(f"{where}: category already registered: {name}")
+        names.add(name)
+        for unit in units:
+            if unit in UNIT_CATEGORIES or unit in query.UNIT_NAMES or unit in spellings:
+                raise PackError(f"{where}: unit already registered: {unit}")
+            spellings[unit] = unit
+    # Every spelling, unit names included, must resolve to a single unit
+    for *_, aliases in compiled:
+        for alias, unit in aliases:
+            if spellings.setdefault(alias, unit) != unit or query.UNIT_NAMES.get(alias, unit) != unit:
+                raise PackError(f"{where}: alias already registered: {alias}")
+
+
+def load_pack(path):
+    """Validate a pack and register its categories; return them.
+
+    Nothing is registered if any category, unit or alias of the pack clashes
+    with one already loaded.
+    """
+    compiled = read_pack(path)
+    _check_clashes(compiled, path)
+    categories = []
+    for name, icon, info, units, factors, aliases in compiled:
+        category = register_category(_build(name, icon, info, units, factors))
+        GRAPH.add_category(category)
+        query.register_units(units, aliases)
+        categories.append(category)
+    return categories
+
+
+def pack_files(path):
+    """Return the pack files at ``path``: the file itself or a directory's packs."""
+    path = Path(path)
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if p.suffix in PACK_SUFFIXES)
+    return [path]
+
+
+def load_packs(paths):
+    """Load every pack file or directory of packs in ``paths``, in order."""
+    return [category for path in paths for file in pack_files(path) for category in load_pack(file)]
+
+
+def load_from_env(environ=os.environ):
+    """Load the packs listed in ``CONVERTER_PACKS``, if set."""
+    value = environ.get("CONVERTER_PACKS", "")
+    return load_packs(p for p in value.split(os.pathsep) if p)
@@ -0,0 +1,146 @@
+"""Multi-core bulk conversion of CSV and Parquet files.
+
+The input is split into shards (newline-aligned byte ranges for CSV, groups of
+row groups for Parquet). A process pool converts the shards and the results
+are written back in input order::
+
+    python -m converter.parallel telemetry.csv out.parquet -c bytes -f byte -t gigabyte -w 32
+
+CSV sharding splits on raw newlines, so quoted fields must not contain them.
+"""
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from . import stream
+
+DEFAULT_CHUNK_SIZE = 64 << 20  # bytes per CSV shard
+DEFAULT_ROW_GROUPS = 1         # row groups per Parquet shard
+
+# Per-worker conversion plan, resolved once by the pool initializer
+_plan = None
+
+
+def _init_worker(path, columns, from_unit, to_unit, category, schema):
+    global _plan
+    scale, offset = stream.coefficients(from_unit, to_unit, category)
+    _plan = (path, columns, scale, offset, schema)
+
+
+def _read_csv_shard(path, start, end, schema):
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return pacsv.read_csv(
+        pa.BufferReader(data),
+        read_options=pacsv.ReadOptions(column_names=schema.names),
+        convert_options=stream.csv_convert_options(schema),
+    )
+
+
+def _convert_shard(shard):
+    path, columns, scale, offset, schema = _plan
+    if stream.file_format(path) == "parquet":
+        table = pq.ParquetFile(path).read_row_groups(shard)
+    else:
+        table = _read_csv_shard(path, *shard, schema)
+    batches = [stream.convert_batch(b, columns, scale, offset) for b in table.to_batches()]
+    return batches
+
+
+def _csv_shards(path, chunk_size):
+    """Return the newline-aligned byte ranges of a CSV, after its header."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        f.readline()
+        bounds = [f.tell()]
+        while bounds[-1] + chunk_size < size:
+            f.seek(bounds[-1] + chunk_size)
+            f.readline()
+            if f.tell() >= size:
+                break
+            bounds.append(f.tell())
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def plan_shards(path, chunk_size=DEFAULT_CHUNK_SIZE, row_groups=DEFAULT_ROW_GROUPS):
+    """Return the shards of ``path``: byte ranges for CSV, row group lists for Parquet."""
+    if stream.file_format(path) == "parquet":
+        count = pq.ParquetFile(path).num_row_groups
+        return [list(range(i, min(i + row_groups, count))) for i in range(0, count, row_groups)]
+    return _csv_shards(path, chunk_size)
+
+
+def iter_converted(src, columns, from_unit, to_unit, category=None, workers=None,
+                   chunk_size=DEFAULT_CHUNK_SIZE, row_groups=DEFAULT_ROW_GROUPS, max_pending=None,
+                   schema=None):
+    """Yield converted record batches of ``src`` in input order.
+
+    Every shard is read with ``schema`` (default: :func:`stream.read_schema`),
+    so all workers agree on the column types. At most ``max_pending`` shards
+    (default: twice the worker count) are in flight at once, which bounds
+    memory when the writer falls behind.
+    """
+    # Fail fast on bad units before starting any workers
+    stream.coefficients(from_unit, to_unit, category)
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    schema = schema or stream.read_schema(src, columns)
+    shards = plan_shards(src, chunk_size, row_groups)
+
+    initargs = (src, columns, from_unit, to_unit, category, schema)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as pool:
+        pending = deque()
+        for shard in shards:
+            pending.append(pool.submit(_convert_shard, shard))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def convert_file_parallel(src, dst, columns, from_unit, to_unit, category=None, workers=None,
+                          chunk_size=DEFAULT_CHUNK_SIZE, row_groups=DEFAULT_ROW_GROUPS,
+                          max_pending=None):
+    """Convert ``columns`` of ``src`` into ``dst`` on a process pool; return the row count.
+
+    Columns are typed and written as by :func:`stream.convert_file`.
+    """
+    schema = stream.read_schema(src, columns, text=stream.file_format(dst) == "csv")
+    batches = iter_converted(src, columns, from_unit, to_unit, category, workers,
+                             chunk_size, row_groups, max_pending, schema)
+    return stream.write_batches(dst, batches, stream.output_schema(schema, columns))
+
+
+def build_parser():
+    parser = stream.build_parser()
+    parser.prog = "python -m converter.parallel"
+    parser.add_argument("-w", "--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="bytes per CSV shard")
+    parser.add_argument("--row-groups", type=int, default=DEFAULT_ROW_GROUPS, help="row groups per Parquet shard")
+    parser.add_argument("--max-pending", type=int, help="shards in flight (default: 2x workers)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        rows = convert_file_parallel(args.input, args.output, args.columns, args.from_unit,
+                                     args.to_unit, category=args.category, workers=args.workers,
+                                     chunk_size=args.chunk_size, row_groups=args.row_groups,
+                                     max_pending=args.max_pending)
+    except (ValueError, OSError, pa.ArrowException) as e:
+        print(f"Error in conversion: {e}", file=sys.stderr)
+        return 1
+    print(f"Converted {rows} rows", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
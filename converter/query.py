@@ -0,0 +1,155 @@
+"""Free-text conversion queries such as ``"12.5 km to miles"``.
+
+Resolving the unit part of a query is memoized in a bounded LRU cache keyed
+on the normalized unit text, so ``"12.5 km to miles"`` and ``"3 KM to Miles"``
+share one entry and repeat query shapes skip alias lookup entirely.
+"""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+from .engine import CATEGORIES, UNIT_CATEGORIES
+
+DEFAULT_CACHE_SIZE = 1024
+
+_QUERY = re.compile(
+    r"^\s*(?P<value>[-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?)\s*"
+    r"(?P<from_unit>.+?)\s+(?:to|in|into|as|->)\s+(?P<to_unit>.+?)\s*$",
+    re.IGNORECASE,
+)
+
+# Abbreviations, symbols and plurals accepted for each native unit
+ALIASES = {
+    "meter": ["m", "meters", "metre", "metres"],
+    "kilometer": ["km", "kilometers", "kilometre", "kilometres"],
+    "centimeter": ["cm", "centimeters", "centimetre", "centimetres"],
+    "millimeter": ["mm", "millimeters", "millimetre", "millimetres"],
+    "mile": ["mi", "miles"],
+    "yard": ["yd", "yds", "yards"],
+    "foot": ["ft", "feet"],
+    "inch": ["in", "inches"],
+    "kilogram": ["kg", "kgs", "kilograms", "kilo", "kilos"],
+    "gram": ["g", "grams"],
+    "milligram": ["mg", "milligrams"],
+    "metric_ton": ["t", "tonne", "tonnes", "metric_tons"],
+    "pound": ["lb", "lbs", "pounds"],
+    "ounce": ["oz", "ounces"],
+    "celsius": ["c", "°c", "degc", "deg_c", "centigrade"],
+    "fahrenheit": ["f", "°f", "degf", "deg_f"],
+    "kelvin": ["k", "kelvins"],
+    "liter": ["l", "liters", "litre", "litres"],
+    "milliliter": ["ml", "milliliters", "millilitre", "millilitres"],
+    "cubic_meter": ["m3", "m^3", "cubic_meters", "cubic_metres"],
+    "gallon": ["gal", "gallons"],
+    "quart": ["qt", "quarts"],
+    "pint": ["pt", "pints"],
+    "cup": ["cups"],
+    "fluid_ounce": ["fl_oz", "floz", "fluid_ounces"],
+    "square_meter": ["m2", "m^2", "sq_m", "square_meters", "square_metres"],
+    "square_kilometer": ["km2", "km^2", "sq_km", "square_kilometers", "square_kilometres"],
+    "hectare": ["ha", "hectares"],
+    "acre": ["ac", "acres"],
+    "square_foot": ["ft2", "ft^2", "sq_ft", "square_feet"],
+    "square_inch": ["in2", "in^2", "sq_in", "square_inches"],
+    "second": ["s", "sec", "secs", "seconds"],
+    "minute": ["min", "mins", "minutes"],
+    "hour": ["h", "hr", "hrs", "hours"],
+    "day": ["d", "days"],
+    "week": ["wk", "wks", "weeks"],
+    "month": ["mo", "months"],
+    "year": ["y", "yr", "yrs", "years"],
+    "joule": ["j", "joules"],
+    "kilojoule": ["kj", "kilojoules"],
+    "calorie": ["cal", "calories"],
+    "kilocalorie": ["kcal", "kilocalories"],
+    "watt_hour": ["wh", "watt_hours"],
+    "kilowatt_hour": ["kwh", "kilowatt_hours"],
+    "electron_volt": ["ev", "electron_volts"],
+    "bit": ["bits"],
+    "byte": ["bytes"],
+    "kilobyte": ["kb", "kilobytes"],
+    "megabyte": ["mb", "megabytes"],
+    "gigabyte": ["gb", "gigabytes"],
+    "terabyte": ["tb", "terabytes"],
+}
+
+# Normalized spelling -> canonical unit name
+UNIT_NAMES = {unit: unit for unit in UNIT_CATEGORIES}
+UNIT_NAMES.update((alias, unit) for unit, aliases in ALIASES.items() for alias in aliases)
+
+
+@dataclass(frozen=True)
+class ParsedQuery:
+    value: float
+    category: str
+    from_index: int
+    to_index: int
+
+    @property
+    def from_unit(self):
+        return CATEGORIES[self.category].units[self.from_index]
+
+    @property
+    def to_unit(self):
+        return CATEGORIES[self.category].units[self.to_index]
+
+    def convert(self):
+        return CATEGORIES[self.category].convert_index(self.value, self.from_index, self.to_index)
+
+
+def _normalize_unit(text):
+    return "_".join(text.lower().replace("-", " ").split())
+
+
+def _lookup(text):
+    try:
+        return UNIT_NAMES[text]
+    except KeyError:
+        raise ValueError(f"Unknown unit: {text}") from None
+
+
+def _resolve(from_text, to_text):
+    from_unit, to_unit = _lookup(from_text), _lookup(to_text)
+    category = UNIT_CATEGORIES[from_unit]
+    if UNIT_CATEGORIES[to_unit] is not category:
+        raise ValueError(f"Cannot convert {from_unit} to {to_unit}: "
+                         f"{category.name} vs {UNIT_CATEGORIES[to_unit].name}")
+    return category.name, category.index[from_unit], category.index[to_unit]
+
+
+resolve_units = lru_cache(maxsize=DEFAULT_CACHE_SIZE)(_resolve)
+
+
+def register_units(units, aliases=()):
+    """Make newly registered units and ``(alias, unit)`` spellings parseable."""
+    UNIT_NAMES.update((unit, unit) for unit in units)
+    UNIT_NAMES.update(aliases)
+    resolve_units.cache_clear()
+
+
+def set_cache_size(maxsize):
+    """Replace the query cache with an empty one holding ``maxsize`` entries."""
+    global resolve_units
+    resolve_units = lru_cache(maxsize=maxsize)(_resolve)
+
+
+def cache_info():
+    """Return hit/miss counters and the size of the query cache."""
+    return resolve_units.cache_info()
+
+
+def parse_query(text):
+    """Parse ``"<value> <unit> to <unit>"`` into a :class:`ParsedQuery`."""
+    match = _QUERY.match(text)
+    if match is None:
+        raise ValueError(f"Could not understand query: {text!r}")
+    category, from_index, to_index = resolve_units(
+        _normalize_unit(match["from_unit"]), _normalize_unit(match["to_unit"])
+    )
+    return ParsedQuery(float(match["value"]), category, from_index, to_index)
+
+
+def convert_query(text):
+    """Parse and evaluate a free-text query; return ``(parsed, result)``."""
+    parsed = parse_query(text)
+    return parsed, parsed.convert()
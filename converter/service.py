@@ -0,0 +1,285 @@
+"""Headless HTTP/JSON conversion service on plain asyncio.
+
+Endpoints (all responses are JSON)::
+
+    GET  /health
+    GET  /categories
+    POST /convert        {"value": 1, "from": "mile", "to": "kilometer"}
+    POST /convert/batch  {"values": [1, 2], "from": "mile", "to": "kilometer"}
+    POST /query          {"query": "12.5 km to miles"}
+
+``category`` may be given to restrict units to one native category; without
+it, units outside the native tables go through the pint fallback. Connections
+are kept alive and requests are answered strictly in order, so clients may
+pipeline. Run with ``python -m converter.service --port 8080``.
+"""
+import argparse
+import asyncio
+import json
+import math
+
+from . import fallback
+from .engine import CATEGORIES, get_category
+from .query import convert_query
+
+MAX_BODY_SIZE = 16 << 20
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 501: "Not Implemented"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _field(body, name):
+    if not isinstance(body, dict):
+        raise ValueError("Request body must be a JSON object")
+    try:
+        return body[name]
+    except KeyError:
+        raise ValueError(f"Missing field: {name}") from None
+
+
+def _reject_constant(name):
+    raise ValueError(f"Invalid JSON number: {name}")
+
+
+def _finite(result):
+    if not math.isfinite(result):
+        raise ValueError("Result is not a finite number")
+    return result
+
+
+def _numbers(values):
+    if not isinstance(values, list) or not all(
+            isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        raise ValueError("'values' must be a list of numbers")
+    return values
+
+
+def _coefficients(body):
+    from_unit, to_unit = _field(body, "from"), _field(body, "to")
+    category = body.get("category")
+    if category is not None:
+        cat = get_category(category)
+        for unit in (from_unit, to_unit):
+            if unit not in cat.index:
+                raise ValueError(f"Unknown unit for {cat.name}: {unit}")
+        return cat.coefficients(from_unit, to_unit)
+    return fallback.coefficients(from_unit, to_unit)
+
+
+def _health(body):
+    return {"status": "ok"}
+
+
+def _categories(body):
+    return {name: list(c.units) for name, c in CATEGORIES.items()}
+
+
+def _convert(body):
+    scale, offset = _coefficients(body)
+    return {"result": _finite(float(_field(body, "value")) * scale + offset)}
+
+
+def _convert_batch(body):
+    import numpy as np
+
+    from .batch import apply_coefficients
+
+    scale, offset = _coefficients(body)
+    with np.errstate(over="ignore", invalid="ignore"):
+        results = apply_coefficients(_numbers(_field(body, "values")), scale, offset)
+    if results.dtype.kind != "f" or not np.isfinite(results).all():
+        raise ValueError("Results must be finite numbers")
+    return {"results": results.tolist()}
+
+
+def _query(body):
+    parsed, result = convert_query(_field(body, "query"))
+    return {"category": parsed.category, "value": parsed.value, "from": parsed.from_unit,
+            "to": parsed.to_unit, "result": _finite(result)}
+
+
+ROUTES = {
+    "/health": ("GET", _health),
+    "/categories": ("GET", _categories),
+    "/convert": ("POST", _convert),
+    "/convert/batch": ("POST", _convert_batch),
+    "/query": ("POST", _query),
+}
+
+
+def dispatch(method, path, payload):
+    """Route one request; return ``(status, response dict)``."""
+    route = ROUTES.get(path.split("?", 1)[0])
+    if route is None:
+        return 404, {"error": f"Not found: {path}"}
+    expected, handler = route
+    if method != expected:
+        return 405, {"error": f"Use {expected} for {path}"}
+    try:
+        body = json.loads(payload, parse_constant=_reject_constant) if payload else {}
+        return 200, handler(body)
+    except (ValueError, TypeError, OverflowError) as e:
+        # Bad input: json.JSONDecodeError and unknown units are ValueErrors
+        return 400, {"error": str(e)}
+    except Exception as e:
+        return 500, {"error": f"Internal error: {type(e).__name__}"}
+
+
+async def _read_request(reader):
+    """Return ``(method, path, headers, body)``, or ``None`` at end of stream."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError:
+        raise HTTPError(400, "Request head too large") from None
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, path, version = lines[0].split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "Malformed request line") from None
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    # Chunked bodies are not decoded; reading on as if there were none would
+    # take the body for the next request
+    if "transfer-encoding" in headers:
+        raise HTTPError(501, "Transfer-Encoding is not supported")
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise HTTPError(400, "Invalid Content-Length")
+    if length > MAX_BODY_SIZE:
+        raise HTTPError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b""
+    keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+    return method, path, keep_alive, body
+
+
+def _response(status, payload, keep_alive=True):
+    body = json.dumps(payload, allow_nan=False).encode()
+    head = (
+        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode() + body
+
+
+async def handle_connection(reader, writer):
+    try:
+        while True:
+            try:
+                request = await _read_request(reader)
+            except HTTPError as e:
+                writer.write(_response(e.status, {"error": str(e)}, keep_alive=False))
+                break
+            if request is None:
+                break
+            method, path, keep_alive, body = request
+            status, payload = dispatch(method, path, body)
+            # Responses go out in request order, so pipelined requests are
+            # answered back to back; drain only blocks past the high-water mark
+            writer.write(_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(host="127.0.0.1", port=8080):
+    return await asyncio.start_server(handle_connection, host, port)
+
+
+class Client:
+    """Minimal keep-alive client, mainly for talking to an in-process server.
+
+    ::
+
+        async with Client.in_process() as client:
+            status, body = await client.post("/convert", {"value": 1, "from": "mile", "to": "meter"})
+    """
+
+    def __init__(self, host, port, server=None):
+        self.host, self.port = host, port
+        self._server = server
+        self._reader = self._writer = None
+
+    @classmethod
+    def in_process(cls):
+        return cls(None, None)
+
+    async def __aenter__(self):
+        if self.port is None:
+            self._server = await start_server("127.0.0.1", 0)
+            self.host, self.port = self._server.sockets[0].getsockname()[:2]
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._writer.close()
+        await self._writer.wait_closed()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def _request(self, method, path, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Length: {len(body)}\r\n\r\n"
+        return head.encode() + body
+
+    async def _read_response(self):
+        head = await self._reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        status = int(lines[0].split(" ", 2)[1])
+        length = next(int(line.split(":", 1)[1]) for line in lines[1:]
+                      if line.lower().startswith("content-length:"))
+        return status, json.loads(await self._reader.readexactly(length))
+
+    async def get(self, path):
+        return (await self.pipeline([("GET", path, None)]))[0]
+
+    async def post(self, path, payload):
+        return (await self.pipeline([("POST", path, payload)]))[0]
+
+    async def pipeline(self, requests):
+        """Send ``(method, path, payload)`` requests back to back; return responses in order."""
+        self._writer.write(b"".join(self._request(*r) for r in requests))
+        await self._writer.drain()
+        return [await self._read_response() for _ in requests]
+
+
+async def serve(host, port):
+    server = await start_server(host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m converter.service",
+                                     description="Run the HTTP/JSON conversion service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
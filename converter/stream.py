@@ -0,0 +1,190 @@
+"""Streaming conversion of columns in CSV and Parquet files.
+
+Files are read and written one record batch at a time, so memory use depends
+on the batch size rather than the size of the file::
+
+    python -m converter.stream telemetry.csv out.csv -c distance -f mile -t kilometer
+
+Every column keeps one type for the whole file: converted columns are read as
+float64, and the other columns of a CSV input are read as text when writing
+CSV (so they are written back verbatim, leading zeros included) or with the
+types inferred from its first block when writing Parquet.
+"""
+import argparse
+import csv
+import io
+import sys
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from . import fallback
+from .engine import get_category
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+DEFAULT_BLOCK_SIZE = 1 << 20  # bytes per CSV block
+DEFAULT_BATCH_SIZE = 65536    # rows per Parquet batch
+
+
+def file_format(path):
+    return "parquet" if str(path).lower().endswith(PARQUET_SUFFIXES) else "csv"
+
+
+def coefficients(from_unit, to_unit, category=None):
+    # Without a category, units outside the native tables go through pint
+    if category is None:
+        return fallback.coefficients(from_unit, to_unit)
+    return get_category(category).coefficients(from_unit, to_unit)
+
+
+def convert_batch(batch, columns, scale, offset):
+    """Return ``batch`` with each named column mapped to ``value * scale + offset``."""
+    arrays = list(batch.columns)
+    for name in columns:
+        i = batch.schema.get_field_index(name)
+        if i < 0:
+            raise ValueError(f"Column not found: {name}")
+        converted = pc.multiply(arrays[i].cast(pa.float64()), scale)
+        if offset:
+            converted = pc.add(converted, offset)
+        arrays[i] = converted
+    return pa.RecordBatch.from_arrays(arrays, names=batch.schema.names)
+
+
+def read_schema(path, columns=(), text=False):
+    """Return the schema every block of ``path`` is read with.
+
+    For CSV input, ``columns`` are float64 and the others are strings when
+    ``text`` is set, or otherwise keep the types inferred from the first block.
+    """
+    if file_format(path) == "parquet":
+        return pq.read_schema(path)
+    convert_options = pacsv.ConvertOptions(column_types={name: pa.float64() for name in columns})
+    inferred = pacsv.open_csv(path, convert_options=convert_options).schema
+    return pa.schema([
+        (f.name, pa.float64() if f.name in columns else pa.string() if text else f.type)
+        for f in inferred
+    ])
+
+
+def csv_convert_options(schema):
+    # Fixed types for every block: inferring them per block would reject
+    # e.g. 1.5 arriving after a block of integers
+    return pacsv.ConvertOptions(column_types={f.name: f.type for f in schema})
+
+
+def output_schema(schema, columns, scale=1.0, offset=0.0):
+    """Return the schema of converted batches read with ``schema``."""
+    empty = pa.RecordBatch.from_pylist([], schema=schema)
+    return convert_batch(empty, columns, scale, offset).schema
+
+
+def iter_batches(path, schema=None, block_size=DEFAULT_BLOCK_SIZE, batch_size=DEFAULT_BATCH_SIZE):
+    if file_format(path) == "parquet":
+        yield from pq.ParquetFile(path).iter_batches(batch_size=batch_size)
+    else:
+        yield from pacsv.open_csv(path, read_options=pacsv.ReadOptions(block_size=block_size),
+                                  convert_options=csv_convert_options(schema or read_schema(path)))
+
+
+def _csv_bytes(batch, quoting_style):
+    buffer = pa.BufferOutputStream()
+    pacsv.write_csv(batch, buffer, pacsv.WriteOptions(include_header=False, quoting_style=quoting_style))
+    return buffer.getvalue()
+
+
+class CSVTextWriter:
+    """CSV writer that only quotes values when a batch needs it.
+
+    pyarrow's writer quotes every string, which would rewrite passthrough
+    text columns; here a batch is written unquoted unless one of its values
+    contains a delimiter, quote or newline.
+    """
+
+    def __init__(self, path, schema):
+        self._sink = pa.OSFile(str(path), "wb")
+        header = io.StringIO()
+        csv.writer(header, lineterminator="\n").writerow(schema.names)
+        self._sink.write(header.getvalue().encode())
+
+    def write_batch(self, batch):
+        try:
+            data = _csv_bytes(batch, "none")
+        except pa.ArrowInvalid:
+            data = _csv_bytes(batch, "needed")
+        self._sink.write(data)
+
+    def close(self):
+        self._sink.close()
+
+
+def open_writer(path, schema):
+    if file_format(path) == "parquet":
+        return pq.ParquetWriter(path, schema)
+    return CSVTextWriter(path, schema)
+
+
+def write_batches(path, batches, schema=None):
+    """Write record batches to ``path`` as they arrive; return the row count.
+
+    If no batch arrives, an empty file with ``schema`` is written, when given.
+    """
+    writer = None
+    rows = 0
+    try:
+        for batch in batches:
+            if writer is None:
+                writer = open_writer(path, batch.schema)
+            writer.write_batch(batch)
+            rows += batch.num_rows
+        if writer is None and schema is not None:
+            writer = open_writer(path, schema)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def convert_file(src, dst, columns, from_unit, to_unit, category=None,
+                 block_size=DEFAULT_BLOCK_SIZE, batch_size=DEFAULT_BATCH_SIZE):
+    """Stream ``src`` to ``dst`` converting ``columns``; return the row count."""
+    scale, offset = coefficients(from_unit, to_unit, category)
+    schema = read_schema(src, columns, text=file_format(dst) == "csv")
+    batches = iter_batches(src, schema, block_size=block_size, batch_size=batch_size)
+    return write_batches(dst, (convert_batch(b, columns, scale, offset) for b in batches),
+                         output_schema(schema, columns, scale, offset))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m converter.stream",
+        description="Convert columns of a CSV or Parquet file between units.",
+    )
+    parser.add_argument("input", help="source .csv or .parquet file")
+    parser.add_argument("output", help="destination .csv or .parquet file")
+    parser.add_argument("-c", "--columns", nargs="+", required=True, help="columns to convert")
+    parser.add_argument("-f", "--from", dest="from_unit", required=True, help="source unit")
+    parser.add_argument("-t", "--to", dest="to_unit", required=True, help="target unit")
+    parser.add_argument("--category", help="conversion category (inferred from the units by default)")
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE, help="bytes per CSV block")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="rows per Parquet batch")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        rows = convert_file(args.input, args.output, args.columns, args.from_unit, args.to_unit,
+                            category=args.category, block_size=args.block_size,
+                            batch_size=args.batch_size)
+    except (ValueError, OSError, pa.ArrowException) as e:
+        print(f"Error in conversion: {e}", file=sys.stderr)
+        return 1
+    print(f"Converted {rows} rows", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
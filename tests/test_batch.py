@@ -0,0 +1,72 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from converter import CATEGORIES, convert_many, convert_to_all, find_category
+
+
+def test_convert_many_infers_the_category():
+    result = convert_many([0, 100, -40], "celsius", "fahrenheit")
+    assert result.dtype == np.float64
+    assert result.tolist() == [32.0, 212.0, -40.0]
+
+
+def test_convert_many_keeps_float_dtype_and_shape():
+    values = np.ones((2, 3), dtype=np.float32)
+    result = convert_many(values, "mile", "kilometer")
+    assert result.dtype == np.float32 and result.shape == (2, 3)
+    np.testing.assert_allclose(result, 1.609344, rtol=1e-6)
+
+
+def test_convert_many_into_out():
+    values = np.array([1.0, 2.0])
+    result = convert_many(values, "kilobyte", "byte", out=values)
+    assert result is values
+    assert values.tolist() == [1024.0, 2048.0]
+
+
+def test_convert_many_reads_buffers():
+    values = memoryview(np.array([1.0, 2.0]))
+    assert convert_many(values, "hour", "minute", category="Time").tolist() == [60.0, 120.0]
+
+
+def test_convert_many_exact():
+    result = convert_many([1, "0.1"], "yard", "foot", exact=True)
+    assert result.dtype == object
+    assert result.tolist() == [3, Fraction(3, 10)]
+
+
+def test_find_category():
+    assert find_category("mile", "meter").name == "Length"
+    with pytest.raises(ValueError, match="Cannot convert"):
+        find_category("mile", "second")
+    with pytest.raises(ValueError, match="Unknown unit"):
+        find_category("mile", "parsec")
+    with pytest.raises(ValueError, match="Cannot convert"):
+        convert_many([1.0], "mile", "second")
+
+
+def test_convert_to_all_scalar_follows_category_units():
+    length = CATEGORIES["Length"]
+    result = convert_to_all(1, "mile")
+    assert result.shape == (len(length.units),)
+    assert result.tolist() == [length.convert(1, "mile", unit) for unit in length.units]
+
+
+def test_convert_to_all_adds_a_trailing_unit_axis():
+    temperature = CATEGORIES["Temperature"]
+    result = convert_to_all(np.array([[0.0, 100.0]]), "celsius", "Temperature")
+    assert result.shape == (1, 2, len(temperature.units))
+    assert result[0, 1, temperature.index["fahrenheit"]] == pytest.approx(212)
+    assert result[0, 0, temperature.index["kelvin"]] == pytest.approx(273.15)
+
+
+@pytest.mark.parametrize("from_unit, category, error", [
+    ("parsec", None, ValueError),
+    ("mile", "Luminosity", ValueError),
+    ("mile", "Time", KeyError),
+])
+def test_convert_to_all_errors(from_unit, category, error):
+    with pytest.raises(error):
+        convert_to_all(1, from_unit, category)
@@ -0,0 +1,40 @@
+import os
+
+import numpy as np
+import pytest
+
+from converter.binary import convert_binary, main
+
+
+def test_convert_to_new_file_in_small_blocks(tmp_path):
+    src, dst = tmp_path / "in.f8", tmp_path / "out.f4"
+    values = np.arange(100_000, dtype=np.float64)
+    values.tofile(src)
+    assert convert_binary(src, dst, "byte", "kilobyte", out_dtype="float32", block_size=1) == len(values)
+    np.testing.assert_allclose(np.fromfile(dst, dtype=np.float32), values / 1024, rtol=1e-6)
+
+
+def test_convert_inplace(tmp_path):
+    src = tmp_path / "temps.f8"
+    np.array([0.0, 100.0]).tofile(src)
+    convert_binary(src, None, "celsius", "fahrenheit", inplace=True)
+    assert np.fromfile(src).tolist() == [32.0, 212.0]
+
+
+def test_same_file_without_inplace_is_rejected(tmp_path):
+    src = tmp_path / "in.f8"
+    np.array([1.0, 2.0]).tofile(src)
+    link = tmp_path / "link.f8"
+    os.symlink(src, link)
+    for dst in (src, link):
+        with pytest.raises(ValueError, match="--inplace"):
+            convert_binary(src, dst, "mile", "meter")
+    assert main([str(src), str(link), "-f", "mile", "-t", "meter"]) == 1
+    assert np.fromfile(src).tolist() == [1.0, 2.0]
+
+
+def test_partial_values_are_rejected(tmp_path):
+    src = tmp_path / "in.f8"
+    src.write_bytes(b"\0" * 12)
+    with pytest.raises(ValueError, match="whole number"):
+        convert_binary(src, tmp_path / "out.f8", "mile", "meter")
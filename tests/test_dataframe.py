@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import converter.dataframe  # noqa: F401
+from converter.dataframe import convert_table_column
+
+
+def frame():
+    return pd.DataFrame({"dist": [1.0, 2.0], "elev": [1000.0, 0.0], "id": [1, 2]})
+
+
+def test_series_convert_records_unit():
+    result = frame()["dist"].units.convert("mile", "kilometer")
+    assert result.tolist() == pytest.approx([1.609344, 3.218688])
+    assert result.units.unit == "kilometer"
+    assert result.units.convert("mile", "kilometer") is result
+    with pytest.raises(ValueError, match="Column is in kilometer"):
+        result.units.convert("foot", "meter")
+
+
+def test_frame_convert_twice_is_a_no_op():
+    df = frame()
+    df = df.units.convert("dist", "mile", "kilometer")
+    df = df.units.convert("dist", "mile", "kilometer")
+    assert df["dist"].tolist() == pytest.approx([1.609344, 3.218688])
+    assert df.units.units == {"dist": "kilometer"}
+
+
+def test_frame_convert_inplace_writes_the_buffer():
+    df = frame()
+    buffer = df["elev"].to_numpy(copy=False)
+    assert df.units.convert(["elev"], "foot", "meter", inplace=True) is None
+    df.units.convert("elev", "foot", "meter", inplace=True)
+    assert np.shares_memory(buffer, df["elev"].to_numpy(copy=False))
+    assert df["elev"].tolist() == pytest.approx([304.8, 0.0])
+    assert df.units.units == {"elev": "meter"}
+
+
+def test_frame_convert_leaves_the_original_alone():
+    df = frame()
+    converted = df.units.convert("id", "kilobyte", "byte")
+    assert converted["id"].tolist() == [1024.0, 2048.0]
+    assert df["id"].tolist() == [1, 2]
+    assert df.attrs == {}
+
+
+def test_reading_units_does_not_mutate_attrs():
+    df = frame()
+    assert df.units.units == {}
+    assert df.attrs == {}
+    df.units.set(dist="mile")
+    assert df["dist"].units.to("meter").tolist() == pytest.approx([1609.344, 3218.688])
+
+
+def test_arrow_column_metadata():
+    table = pa.table({"temp": [0.0, None, 100.0]})
+    table = convert_table_column(table, "temp", "celsius", "fahrenheit")
+    assert table.column("temp").to_pylist() == [32.0, None, 212.0]
+    assert table.schema.field("temp").metadata == {b"unit": b"fahrenheit"}
+    assert convert_table_column(table, "temp", "celsius", "fahrenheit") is table
@@ -0,0 +1,69 @@
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from converter import CATEGORIES, convert, get_category
+
+
+@pytest.mark.parametrize("category, value, from_unit, to_unit, expected", [
+    ("Length", 1, "mile", "kilometer", 1.609344),
+    ("Length", 12, "inch", "foot", 1.0),
+    ("Weight/Mass", 1, "pound", "gram", 453.59237),
+    ("Temperature", 100, "celsius", "fahrenheit", 212.0),
+    ("Temperature", 32, "fahrenheit", "kelvin", 273.15),
+    ("Volume", 1, "gallon", "liter", 3.785411784),
+    ("Area", 1, "hectare", "square_meter", 10000.0),
+    ("Time", 1, "day", "second", 86400.0),
+    ("Energy", 1, "kilocalorie", "joule", 4184.0),
+    ("Digital", 1, "kilobyte", "bit", 8192.0),
+])
+def test_convert(category, value, from_unit, to_unit, expected):
+    assert convert(category, value, from_unit, to_unit) == pytest.approx(expected, rel=1e-15)
+
+
+def test_round_trip_every_pair():
+    for category in CATEGORIES.values():
+        for from_unit in category.units:
+            for to_unit in category.units:
+                there = category.convert(3.25, from_unit, to_unit)
+                assert category.convert(there, to_unit, from_unit) == pytest.approx(3.25, rel=1e-12)
+
+
+def test_category_labels():
+    assert CATEGORIES["Length"].label == "📏 Length"
+    assert get_category("Temperature").units == ("celsius", "fahrenheit", "kelvin")
+
+
+def test_unknown_category():
+    with pytest.raises(ValueError, match="Unknown conversion category"):
+        get_category("Luminosity")
+
+
+@pytest.mark.parametrize("name", list(CATEGORIES))
+def test_float_matrix_is_exact_matrix_rounded_once(name):
+    category = CATEGORIES[name]
+    for row, exact_row in zip(category.matrix, category.exact_matrix):
+        for pair, (scale, offset) in zip(row, exact_row):
+            assert pair == (float(scale), float(offset))
+
+
+def test_index_and_coefficients_agree():
+    length = CATEGORIES["Length"]
+    i, j = length.index["mile"], length.index["meter"]
+    assert length.convert_index(2, i, j) == length.convert(2, "mile", "meter")
+    assert length.coefficients("mile", "meter") == (1609.344, 0.0)
+    assert length.base_unit == "meter"
+    assert length.pairs["mile"]["meter"] is length.matrix[i][j]
+
+
+def test_convert_by_name_reports_unknown_units():
+    with pytest.raises(KeyError):
+        convert("Length", 1, "mile", "parsec")
+
+
+def test_exact_mode():
+    assert convert("Temperature", "98.6", "fahrenheit", "celsius", exact=True) == 37
+    assert convert("Length", Fraction(1, 3), "yard", "foot", exact=True) == 1
+    result = convert("Length", Decimal("1"), "mile", "meter", exact=True)
+    assert isinstance(result, Decimal) and result == Decimal("1609.344")
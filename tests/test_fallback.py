@@ -0,0 +1,28 @@
+import pytest
+
+from converter.fallback import convert_units
+
+
+@pytest.mark.parametrize("value, from_unit, to_unit, expected", [
+    (1, "kilobyte", "bit", 8192),
+    (1, "kilobyte", "kbit", 8.192),
+    (1, "year", "day", 365.2425),
+    (1, "year", "d", 365.2425),
+    (1, "kilobyte/second", "kbit/s", 8.192),
+    (1, "acre", "ft**2", 43560),
+    (1, "inch", "mm", 25.4),
+])
+def test_native_units_keep_engine_definitions(value, from_unit, to_unit, expected):
+    assert convert_units(value, from_unit, to_unit) == pytest.approx(expected, rel=1e-12)
+
+
+def test_offset_units_are_exact():
+    assert convert_units(1000, "degC", "degF") == 1832.0
+    assert convert_units(100, "celsius", "degF") == 212.0
+    assert convert_units(212, "fahrenheit", "degC") == 100.0
+
+
+@pytest.mark.parametrize("unit", ["(", "meter)", "1/0", "no_such_unit", "second"])
+def test_bad_expressions_raise_value_error(unit):
+    with pytest.raises(ValueError):
+        convert_units(1, unit, "meter")
@@ -0,0 +1,56 @@
+import pytest
+
+from converter import UnitGraph, convert_derived
+from converter.graph import GRAPH, MAX_POWER, RESOLVE_CACHE_SIZE
+
+
+@pytest.mark.parametrize("value, from_unit, to_unit, expected", [
+    (24, "kilowatt_hour/day", "watt", 1000),
+    (3.6, "gigabyte/hour", "megabyte/second", 1.024),
+    (1, "foot^2", "square_meter", 0.09290304),
+    (1, "liter", "meter^3", 0.001),
+    (1, "joule", "kilogram*meter^2/second^2", 1),
+    (100, "celsius", "fahrenheit", 212),
+])
+def test_convert_derived(value, from_unit, to_unit, expected):
+    assert convert_derived(value, from_unit, to_unit) == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("from_unit, to_unit", [
+    ("kilowatt_hour", "watt"),
+    ("meter/second", "meter^2"),
+    ("byte", "second"),
+])
+def test_incompatible_dimensions(from_unit, to_unit):
+    with pytest.raises(ValueError, match="incompatible dimensions"):
+        convert_derived(1, from_unit, to_unit)
+
+
+@pytest.mark.parametrize("expression", ["celsius/second", "fahrenheit^2", "kelvin*celsius"])
+def test_affine_units_in_compound_expressions(expression):
+    with pytest.raises(ValueError, match="Affine unit"):
+        convert_derived(1, expression, "kelvin/second")
+
+
+@pytest.mark.parametrize("expression, message", [
+    ("mile^100000", "total power"),
+    ("*".join(["mile"] * (MAX_POWER + 1)), "total power"),
+    ("parsec", "Unknown unit"),
+    ("meter^", "Cannot parse"),
+])
+def test_bad_expressions(expression, message):
+    with pytest.raises(ValueError, match=message):
+        convert_derived(1, expression, "meter")
+
+
+def test_caches_are_bounded_and_reset_on_change():
+    graph = UnitGraph()
+    graph.add_edge("kilometer", "meter", 1000)
+    assert graph.coefficients("kilometer", "meter") == (1000.0, 0.0)
+    assert graph.coefficients("kilometer", "meter") == (1000.0, 0.0)
+    assert graph._pairs.cache_info().hits == 1
+    assert GRAPH._resolved.cache_info().maxsize == RESOLVE_CACHE_SIZE
+
+    graph.add_edge("mile", "meter", 1609.344)
+    assert graph._pairs.cache_info().currsize == 0
+    assert graph.coefficients("mile", "kilometer") == (1.609344, 0.0)
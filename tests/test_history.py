@@ -0,0 +1,50 @@
+import math
+
+import pytest
+
+from converter.history import CSV_HEADER, ConversionHistory
+
+
+def test_ring_buffer_keeps_the_newest_entries():
+    history = ConversionHistory(3)
+    for value in range(5):
+        assert history.append("Length", float(value), "meter", "centimeter", value * 100.0)
+    assert len(history) == 3
+    assert [record[0] for record in history.records()] == [2.0, 3.0, 4.0]
+    assert history.records()[-1] == (4.0, "Length", "meter", "centimeter", 400.0)
+
+
+def test_repeats_of_the_latest_entry_are_skipped():
+    history = ConversionHistory()
+    assert history.append("Length", 1.0, "mile", "meter", 1609.344)
+    assert not history.append("Length", 1.0, "mile", "meter", 1609.344)
+    assert history.append("Length", 1.0, "mile", "foot", 5280.0)
+    assert history.append("Length", 1.0, "mile", "meter", 1609.344)
+    assert len(history) == 3
+
+
+def test_rerun_gives_nan_for_other_categories():
+    history = ConversionHistory(2)
+    history.append("Temperature", 100.0, "celsius", "kelvin", 373.15)
+    history.append("Length", 1.0, "mile", "meter", 1609.344)
+    history.append("Temperature", 0.0, "celsius", "kelvin", 273.15)
+    length, temperature = history.rerun("fahrenheit")
+    assert math.isnan(length)
+    assert temperature == pytest.approx(32.0)
+    with pytest.raises(ValueError, match="Unknown unit"):
+        history.rerun("parsec")
+
+
+def test_to_csv_and_clear():
+    history = ConversionHistory()
+    history.append("Digital", 1.0, "kilobyte", "byte", 1024.0)
+    lines = history.to_csv().splitlines()
+    assert lines == [",".join(CSV_HEADER), "1.0,Digital,kilobyte,byte,1024.0"]
+    history.clear()
+    assert len(history) == 0 and history.records() == []
+
+
+@pytest.mark.parametrize("capacity", [0, -1])
+def test_capacity_must_be_positive(capacity):
+    with pytest.raises(ValueError, match="at least 1"):
+        ConversionHistory(capacity)
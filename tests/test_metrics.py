@@ -0,0 +1,54 @@
+import socket
+
+import pytest
+
+from converter import metrics
+
+
+@pytest.fixture
+def enabled():
+    metrics.enable()
+    metrics.reset()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+def test_disabled_is_a_shared_no_op():
+    metrics.disable()
+    assert metrics.track_conversion("Length") is metrics.track_conversion("Time")
+    assert metrics.start_rerun() is None
+
+
+def test_counts_calls_and_errors(enabled):
+    with metrics.track_conversion("Length"):
+        pass
+    with pytest.raises(ValueError):
+        with metrics.track_conversion("query"):
+            raise ValueError("bad query")
+    assert metrics.calls == {"Length": 1, "query": 1}
+    assert metrics.errors == {"query": 1}
+    text = metrics.render_prometheus()
+    assert 'converter_conversion_errors_total{category="query"} 1' in text
+
+
+def test_serve_from_env_survives_a_taken_port(enabled, monkeypatch, caplog):
+    with socket.socket() as taken:
+        taken.bind(("127.0.0.1", 0))
+        taken.listen()
+        monkeypatch.setenv("CONVERTER_METRICS_PORT", str(taken.getsockname()[1]))
+        monkeypatch.setattr(metrics, "_server_error", None)
+        metrics.serve_from_env()
+        metrics.serve_from_env()
+    assert metrics._server is None
+    assert len([r for r in caplog.records if "Metrics endpoint not started" in r.message]) == 1
+
+
+def test_http_server_binds_localhost_by_default(monkeypatch):
+    monkeypatch.setattr(metrics, "_server", None)
+    server = metrics.start_http_server(0)
+    try:
+        assert server.server_address[0] == "127.0.0.1"
+    finally:
+        server.shutdown()
+        server.server_close()
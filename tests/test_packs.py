@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+from converter import CATEGORIES, PackError, load_pack
+from converter.engine import Category, register_category
+from converter.packs import compile_pack, read_pack
+
+PACK = """
+[[category]]
+name = "{name}"
+base = "{base}"
+
+[category.units]
+{base} = 1
+{other} = "5/9"
+
+[category.aliases]
+{other} = {aliases}
+"""
+
+
+def write_pack(path, name="Test Pack", base="test_base", other="test_other", aliases='["tother"]'):
+    path.write_text(PACK.format(name=name, base=base, other=other, aliases=aliases))
+    return path
+
+
+@pytest.mark.parametrize("pack, message", [
+    ('category = "x"', "expected a list of categories"),
+    ('[[category]]\nunits = {a = 1}', "missing category name"),
+    ('[[category]]\nname = "X"\nunits = {}', "'units' must be a non-empty table"),
+    ('[[category]]\nname = "X"\nunits = {Bad = 1}', "invalid unit name"),
+    ('[[category]]\nname = "X"\nunits = {a = 1, b = true}', "factor must be a number or string"),
+    ('[[category]]\nname = "X"\nunits = {a = 1, b = "1/0"}', "invalid factor"),
+    ('[[category]]\nname = "X"\nunits = {a = 1, b = -2}', "scale must be positive"),
+    ('[[category]]\nname = "X"\nunits = {a = 2}', "factor of exactly 1"),
+    ('[[category]]\nname = "X"\nbase = "b"\nunits = {a = 1}', "is not one of its units"),
+    ('[[category]]\nname = "X"\nunits = {a = 1}\naliases = {b = "bb"}', "aliases for unknown unit"),
+    ("not toml [", "Expected"),
+])
+def test_validation_errors(tmp_path, pack, message):
+    path = tmp_path / "pack.toml"
+    path.write_text(pack)
+    with pytest.raises(PackError, match=message):
+        compile_pack(path)
+
+
+def test_pack_files_must_be_toml_or_json(tmp_path):
+    with pytest.raises(PackError, match="must be .toml or .json"):
+        compile_pack(tmp_path / "pack.yaml")
+
+
+@pytest.mark.parametrize("fields, message", [
+    ({"name": "Length"}, "category already registered"),
+    ({"base": "meter"}, "unit already registered: meter"),
+    ({"other": "kb"}, "unit already registered: kb"),
+    ({"other": "mi"}, "unit already registered: mi"),
+    ({"aliases": '["km"]'}, "alias already registered: km"),
+])
+def test_clashes_register_nothing(tmp_path, fields, message):
+    path = tmp_path / "pack.toml"
+    # A clean category first: the clash in the second must keep both out
+    path.write_text(PACK.format(name="Clean Pack", base="clean_base", other="clean_other",
+                                aliases="[]")
+                    + PACK.format(**{"name": "Test Pack", "base": "test_base",
+                                     "other": "test_other", "aliases": "[]", **fields}))
+    with pytest.raises(PackError, match=message):
+        load_pack(path)
+    assert "Clean Pack" not in CATEGORIES and "Test Pack" not in CATEGORIES
+
+
+def test_register_category_rejects_clashes():
+    with pytest.raises(ValueError, match="already registered"):
+        register_category(Category("Length", "x", ("furlong",), {"furlong": 1}))
+    with pytest.raises(ValueError, match="meter"):
+        register_category(Category("Lengths", "x", ("meter",), {"meter": 1}))
+
+
+def test_compiled_pack_is_cached_until_the_file_changes(tmp_path):
+    path = write_pack(tmp_path / "pack.toml")
+    compiled = read_pack(path)
+    cache = tmp_path / "__pycache__" / "pack.toml.unitpack"
+    assert cache.exists()
+
+    # Corrupt the source without touching size or mtime: the cache is used
+    stat = path.stat()
+    path.write_text(path.read_text().replace("[[category]]", "[[broken]]  "))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert path.stat().st_size == stat.st_size
+    assert read_pack(path) == compiled
+
+    # Any change to the file makes it parse again
+    write_pack(path, other="test_renamed")
+    assert read_pack(path)[0][3] == ("test_base", "test_renamed")
+
+
+def test_corrupt_cache_is_rebuilt(tmp_path):
+    path = write_pack(tmp_path / "pack.toml")
+    compiled = read_pack(path)
+    (tmp_path / "__pycache__" / "pack.toml.unitpack").write_bytes(b"garbage")
+    assert read_pack(path) == compiled
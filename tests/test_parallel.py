@@ -0,0 +1,50 @@
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import pytest
+
+from converter.parallel import convert_file_parallel
+
+
+def test_csv_shards_with_differing_passthrough_values(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    rows = [f"{i},{i},{i}" for i in range(2000)] + ["2000,1.5,n/a", "2001,,"]
+    src.write_text("distance,id,note\n" + "\n".join(rows) + "\n")
+    assert convert_file_parallel(src, dst, ["distance"], "mile", "meter", workers=2,
+                                 chunk_size=4096) == 2002
+    lines = dst.read_text().splitlines()
+    assert lines[0] == "distance,id,note"
+    assert lines[-3:] == ["3217078.656,1999,1999", "3218688,1.5,n/a", "3220297.344,,"]
+
+
+def test_csv_passthrough_written_verbatim(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    src.write_text("zip,distance\n00123,1\n")
+    convert_file_parallel(src, dst, ["distance"], "kilometer", "meter", workers=1)
+    assert dst.read_text() == "zip,distance\n00123,1000\n"
+
+
+def test_csv_to_parquet_keeps_passthrough_types(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.parquet"
+    rows = [f"{i},{i},{i % 2 == 0}" for i in range(2000)]
+    src.write_text("distance,id,flag\n" + "\n".join(rows) + "\n")
+    assert convert_file_parallel(src, dst, ["distance"], "kilometer", "meter", workers=2,
+                                 chunk_size=4096) == 2000
+    table = pq.read_table(dst)
+    assert [f.type for f in table.schema] == [pa.float64(), pa.int64(), pa.bool_()]
+    assert table.column("id").to_pylist() == list(range(2000))
+    assert table.column("distance")[3].as_py() == 3000.0
+
+
+def test_parquet_row_group_shards(tmp_path):
+    src, dst = tmp_path / "in.parquet", tmp_path / "out.parquet"
+    pq.write_table(pa.table({"bytes": [1024.0 * i for i in range(10)]}), src, row_group_size=3)
+    assert convert_file_parallel(src, dst, ["bytes"], "byte", "kilobyte", workers=2) == 10
+    assert pq.read_table(dst).column("bytes").to_pylist() == [float(i) for i in range(10)]
+
+
+def test_header_only_csv_writes_empty_output(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    src.write_text("distance,id\n")
+    assert convert_file_parallel(src, dst, ["distance"], "mile", "meter", workers=1) == 0
+    assert pacsv.read_csv(dst).schema.names == ["distance", "id"]
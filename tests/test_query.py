@@ -0,0 +1,42 @@
+import pytest
+
+from converter import convert_query, parse_query, query
+
+
+@pytest.mark.parametrize("text, category, from_unit, to_unit", [
+    ("12.5 km to miles", "Length", "kilometer", "mile"),
+    ("3 ft in cm", "Length", "foot", "centimeter"),
+    ("-40 °F to °C", "Temperature", "fahrenheit", "celsius"),
+    ("1.5e3 mb to gigabytes", "Digital", "megabyte", "gigabyte"),
+    ("2 fl oz to ml", "Volume", "fluid_ounce", "milliliter"),
+])
+def test_parse_query(text, category, from_unit, to_unit):
+    parsed = parse_query(text)
+    assert (parsed.category, parsed.from_unit, parsed.to_unit) == (category, from_unit, to_unit)
+
+
+def test_convert_query():
+    parsed, result = convert_query("-40 fahrenheit to celsius")
+    assert parsed.value == -40
+    assert result == pytest.approx(-40)
+
+
+@pytest.mark.parametrize("text, message", [
+    ("twelve km to miles", "Could not understand"),
+    ("1 parsec to km", "Unknown unit"),
+    ("1 km to kg", "Cannot convert"),
+])
+def test_parse_errors(text, message):
+    with pytest.raises(ValueError, match=message):
+        parse_query(text)
+
+
+def test_resolver_cache_is_bounded_and_reused():
+    query.set_cache_size(2)
+    try:
+        for text in ["1 km to m", "2 km to m", "1 mi to ft", "1 kg to lb"]:
+            parse_query(text)
+        info = query.cache_info()
+        assert (info.hits, info.misses, info.currsize, info.maxsize) == (1, 3, 2, 2)
+    finally:
+        query.set_cache_size(query.DEFAULT_CACHE_SIZE)
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from converter.service import Client, dispatch
+
+
+def run(requests):
+    async def go():
+        async with Client.in_process() as client:
+            return await client.pipeline(requests)
+    return asyncio.run(go())
+
+
+def send_raw(data):
+    async def go():
+        async with Client.in_process() as client:
+            client._writer.write(data)
+            await client._writer.drain()
+            return await client._reader.read()
+    return asyncio.run(go())
+
+
+def test_endpoints():
+    (health, categories, converted, batch, query) = run([
+        ("GET", "/health", None),
+        ("GET", "/categories", None),
+        ("POST", "/convert", {"value": 1, "from": "mile", "to": "kilometer"}),
+        ("POST", "/convert/batch", {"values": [0, 100], "from": "celsius", "to": "fahrenheit"}),
+        ("POST", "/query", {"query": "12 inches to feet"}),
+    ])
+    assert health == (200, {"status": "ok"})
+    assert categories[0] == 200 and "meter" in categories[1]["Length"]
+    assert converted == (200, {"result": 1.609344})
+    assert batch == (200, {"results": [32.0, 212.0]})
+    assert query[0] == 200 and query[1]["result"] == 1.0 and query[1]["to"] == "foot"
+
+
+def test_pipelined_responses_keep_request_order():
+    responses = run([("POST", "/convert", {"value": v, "from": "meter", "to": "centimeter"})
+                     for v in range(50)])
+    assert [body["result"] for _, body in responses] == [v * 100.0 for v in range(50)]
+
+
+def test_fallback_units():
+    (status, body), = run([("POST", "/convert", {"value": 1, "from": "kilobyte", "to": "kbit"})])
+    assert status == 200 and body["result"] == pytest.approx(8.192)
+
+
+@pytest.mark.parametrize("method, path, payload, status, message", [
+    ("GET", "/nope", None, 404, "Not found"),
+    ("GET", "/convert", None, 405, "Use POST"),
+    ("POST", "/convert", b"{not json", 400, "Expecting"),
+    ("POST", "/convert", b"[1]", 400, "JSON object"),
+    ("POST", "/convert", b'{"from": "mile", "to": "meter"}', 400, "Missing field: value"),
+    ("POST", "/convert", b'{"from": "milex", "to": "meter", "category": "Length", "value": 1}',
+     400, "Unknown unit for Length: milex"),
+    ("POST", "/convert", b'{"from": "mile", "to": "meter", "value": NaN}', 400, "NaN"),
+    ("POST", "/convert", b'{"from": "mile", "to": "meter", "value": 1e308}', 400, "finite"),
+    ("POST", "/convert", b'{"from": "(", "to": "meter", "value": 1}', 400, "Cannot convert"),
+    ("POST", "/convert", b'{"from": "mile", "to": "second", "value": 1}', 400, "Cannot convert"),
+    ("POST", "/convert", b'{"from": "mile", "to": "meter", "value": ' + b"9" * 400 + b"}", 400, "too large"),
+    ("POST", "/query", b'{"query": "1 km to kg"}', 400, "Cannot convert"),
+    ("POST", "/convert/batch", b'{"from": "mile", "to": "meter", "values": 5}', 400, "list of numbers"),
+    ("POST", "/convert/batch", b'{"from": "mile", "to": "meter", "values": [[1, 2]]}', 400, "list of numbers"),
+    ("POST", "/convert/batch", b'{"from": "mile", "to": "meter", "values": [1, "2"]}', 400, "list of numbers"),
+    ("POST", "/convert/batch", b'{"from": "mile", "to": "meter", "values": [true]}', 400, "list of numbers"),
+])
+def test_errors(method, path, payload, status, message):
+    got, body = dispatch(method, path, payload)
+    assert got == status
+    assert message in body["error"]
+
+
+@pytest.mark.parametrize("length", [b"abc", b"-5"])
+def test_invalid_content_length(length):
+    response = send_raw(b"POST /convert HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n")
+    assert response.startswith(b"HTTP/1.1 400 ")
+    assert b"Invalid Content-Length" in response
+
+
+def test_oversized_head():
+    response = send_raw(b"GET /health HTTP/1.1\r\nX-Padding: " + b"a" * 70000 + b"\r\n\r\n")
+    assert response.startswith(b"HTTP/1.1 400 ")
+
+
+def test_transfer_encoding_is_rejected():
+    response = send_raw(b"POST /convert HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+                        b"5\r\nhello\r\n0\r\n\r\nGET /health HTTP/1.1\r\n\r\n")
+    assert response.startswith(b"HTTP/1.1 501 ")
+    assert b"Connection: close" in response
+    assert response.count(b"HTTP/1.1") == 1
@@ -0,0 +1,94 @@
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import pytest
+
+from converter.stream import convert_file, main
+
+
+def test_csv_round_trip(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    src.write_text("id,distance,label\n1,1,a\n2,2.5,b\n3,10,c\n")
+    assert convert_file(src, dst, ["distance"], "mile", "kilometer") == 3
+    table = pacsv.read_csv(dst)
+    assert table.column("distance").to_pylist() == pytest.approx([1.609344, 4.02336, 16.09344])
+    assert table.column("label").to_pylist() == ["a", "b", "c"]
+
+    back = tmp_path / "back.csv"
+    convert_file(dst, back, ["distance"], "kilometer", "mile")
+    assert pacsv.read_csv(back).column("distance").to_pylist() == pytest.approx([1, 2.5, 10])
+
+
+def test_parquet_round_trip(tmp_path):
+    src, dst = tmp_path / "in.parquet", tmp_path / "out.parquet"
+    pq.write_table(pa.table({"temp": [0.0, 100.0, -40.0], "id": [1, 2, 3]}), src, row_group_size=2)
+    assert convert_file(src, dst, ["temp"], "celsius", "fahrenheit", category="Temperature",
+                        batch_size=1) == 3
+    table = pq.read_table(dst)
+    assert table.column("temp").to_pylist() == pytest.approx([32.0, 212.0, -40.0])
+    assert table.column("id").to_pylist() == [1, 2, 3]
+
+
+def test_csv_to_parquet(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.parquet"
+    src.write_text("size\n1\n2\n")
+    convert_file(src, dst, ["size"], "kilobyte", "byte")
+    assert pq.read_table(dst).column("size").to_pylist() == [1024.0, 2048.0]
+
+
+def test_missing_column(tmp_path):
+    src = tmp_path / "in.csv"
+    src.write_text("a\n1\n")
+    assert main([str(src), str(tmp_path / "out.csv"), "-c", "b", "-f", "mile", "-t", "meter"]) == 1
+
+
+def test_csv_column_turns_fractional_after_first_block(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    src.write_text("id,distance\n" + "".join(f"{i},{i}\n" for i in range(5000)) + "5000,1.5\n")
+    assert convert_file(src, dst, ["distance"], "mile", "meter", block_size=4096) == 5001
+    assert pacsv.read_csv(dst).column("distance")[-1].as_py() == pytest.approx(2414.016)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_header_only_csv_writes_empty_output(tmp_path, suffix):
+    src, dst = tmp_path / "in.csv", tmp_path / f"out{suffix}"
+    src.write_text("id,distance\n")
+    assert convert_file(src, dst, ["distance"], "mile", "meter") == 0
+    schema = pq.read_schema(dst) if suffix == ".parquet" else pacsv.read_csv(dst).schema
+    assert schema.names == ["id", "distance"]
+
+
+def test_csv_passthrough_column_changes_type_after_first_block(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    rows = "".join(f"{i},{i}\n" for i in range(5000))
+    src.write_text("id,distance\n" + rows + "1.5,1\nabc,2\n")
+    assert convert_file(src, dst, ["distance"], "mile", "meter", block_size=4096) == 5002
+    lines = dst.read_text().splitlines()
+    assert lines[0] == "id,distance"
+    assert lines[1] == "0,0" and lines[-2:] == ["1.5,1609.344", "abc,3218.688"]
+
+
+def test_csv_passthrough_text_is_written_verbatim(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    src.write_text('zip,when,ok,note,distance\n00123,2024-01-01 10:00:00,true,"a, b",1\n00456,,NA,,2\n')
+    convert_file(src, dst, ["distance"], "kilometer", "meter")
+    assert dst.read_text().splitlines() == [
+        "zip,when,ok,note,distance",
+        '"00123","2024-01-01 10:00:00","true","a, b",1000',
+        '"00456","","NA","",2000',
+    ]
+
+
+def test_csv_passthrough_unquoted_when_no_value_needs_quotes(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    src.write_text("zip,when,distance\n00123,2024-01-01 10:00:00,1\n")
+    convert_file(src, dst, ["distance"], "kilometer", "meter")
+    assert dst.read_text() == "zip,when,distance\n00123,2024-01-01 10:00:00,1000\n"
+
+
+def test_csv_to_parquet_keeps_passthrough_types(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.parquet"
+    src.write_text("id,ok,distance\n1,true,1\n2,false,2\n")
+    convert_file(src, dst, ["distance"], "kilometer", "meter")
+    schema = pq.read_schema(dst)
+    assert [schema.field(n).type for n in schema.names] == [pa.int64(), pa.bool_(), pa.float64()]